@@ -8,11 +8,40 @@ including proper headers, error handling, and response parsing.
 import asyncio
 import aiohttp
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Awaitable, Callable, Optional, List, Tuple, Union
+from multidict import CIMultiDict
+from yarl import URL
 from config import Config
+from cache import ResponseCache
+import serialization
 
 logger = logging.getLogger(__name__)
 
+# HTTP methods that send a request body and therefore need a content-type header.
+# Methods are upper-case throughout (Config normalizes status_method on load).
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Status fields compared between fetches to decide whether a meter is idle
+_ACTIVITY_KEYS = ("current_reading", "balance_unit")
+
+# Number of unchanged polls before a meter's status TTL starts to grow
+IDLE_POLLS_BEFORE_BACKOFF = 3
+
+# HTTP methods a 304 Not Modified can answer; other methods get 412 on a matching ETag
+_CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+
+# Returned by _make_request when a conditional request is answered with 304 Not Modified
+STATUS_UNCHANGED = object()
+
+# Returned by _make_request when the server rejects a conditional request with 412
+PRECONDITION_FAILED = object()
+
+# Where a status returned by poll_meter_status came from
+SOURCE_API = "api"
+SOURCE_CACHE = "cache"
+SOURCE_FALLBACK = "fallback"
+
 
 class APIClient:
     """Client for communicating with the iBilik API."""
@@ -20,7 +49,32 @@ class APIClient:
     def __init__(self, config: Config):
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
-        self._headers = self._build_headers()
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        # Headers never change at runtime, so build them once per method family
+        self._headers_get = CIMultiDict(self._build_headers("GET"))
+        self._headers_body = CIMultiDict(self._build_headers("POST"))
+
+        # Low-volatility responses, cached per endpoint key as (fetched at, value)
+        self._ttl_cache: Dict[str, Tuple[float, Any]] = {}
+        # Seconds each cached endpoint stays fresh; the meter list is near-static
+        self._endpoint_ttls: Dict[str, float] = {
+            "meters": config.discovery_ttl_seconds,
+        }
+
+        # Short-lived status cache, also used as a last-known-value fallback
+        self._status_cache = ResponseCache(config.status_ttl_seconds)
+
+        # Last ETag seen per meter, sent back as If-None-Match on status polls
+        self._etags: Dict[str, str] = {}
+
+        # Adaptive status TTL per meter: (consecutive idle polls, current TTL)
+        self._ttl_state: Dict[str, Tuple[int, float]] = {}
+
+        # Fully built status URLs per meter, so polls skip string formatting
+        self._status_urls: Dict[str, URL] = {}
+
+        # Requests currently in flight, so concurrent callers share one round trip
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def _build_headers(self, method: str = "GET") -> Dict[str, str]:
         """Build the standard headers for API requests."""
@@ -33,32 +87,74 @@ class APIClient:
         }
         
         # Only include content-type for methods that send body data
-        if method.upper() in ["POST", "PUT", "PATCH"]:
+        if method in _BODY_METHODS:
             headers["content-type"] = "application/json"
             
         return headers
 
     async def __aenter__(self):
         """Async context manager entry."""
+        # Long-lived pooled connector so polls reuse keep-alive connections
+        self._connector = aiohttp.TCPConnector(
+            limit=self.config.max_concurrency * 2,
+            limit_per_host=self.config.max_concurrency,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
         # Create session without default headers since we'll set them per request
-        self.session = aiohttp.ClientSession()
+        self.session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=aiohttp.ClientTimeout(total=15),
+            json_serialize=serialization.dumps
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        if self._connector:
+            await self._connector.close()
+
+    def _status_url(self, meter_id: str) -> URL:
+        """Get the prebuilt sync-status URL for a meter."""
+        url = self._status_urls.get(meter_id)
+        if url is None:
+            url = URL(f"{self.config.api_base_url}/merchant/meter/{meter_id}/sync-status")
+            self._status_urls[meter_id] = url
+        return url
 
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make an HTTP request to the API."""
+    async def _make_request(self, method: str, endpoint: Union[str, URL], etag_key: Optional[str] = None,
+                            **kwargs) -> Any:
+        """
+        Make an HTTP request to the API.
+
+        The endpoint is either a path relative to the API base URL or an
+        absolute prebuilt URL. When etag_key is given and the method is GET
+        or HEAD, the request is made conditional on the last ETag stored
+        under that key; STATUS_UNCHANGED is returned on 304 and
+        PRECONDITION_FAILED on 412.
+        """
         if not self.session:
             raise RuntimeError("API client session not initialized. Use as async context manager.")
 
-        url = f"{self.config.api_base_url}{endpoint}"
-        headers = self._build_headers(method)
+        url = endpoint if isinstance(endpoint, URL) else f"{self.config.api_base_url}{endpoint}"
+        headers = self._headers_body if method in _BODY_METHODS else self._headers_get
+
+        if method not in _CONDITIONAL_METHODS:
+            etag_key = None
+        conditional = etag_key is not None and etag_key in self._etags
+        if conditional:
+            headers = CIMultiDict(headers)
+            headers["If-None-Match"] = self._etags[etag_key]
 
         try:
             async with self.session.request(method, url, headers=headers, **kwargs) as response:
+                if response.status == 304 and etag_key is not None:
+                    return STATUS_UNCHANGED
+                if response.status == 412 and conditional:
+                    return PRECONDITION_FAILED
                 if response.status == 401:
                     logger.error("Authentication failed - invalid merchant token")
                     raise ValueError("Authentication failed")
@@ -69,7 +165,14 @@ class APIClient:
                     logger.error(f"API request failed with status {response.status}: {response.reason}")
                     response.raise_for_status()
 
-                return await response.json()
+                data = serialization.loads(await response.read())
+
+                if etag_key is not None:
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._etags[etag_key] = etag
+
+                return data
 
         except aiohttp.ClientError as e:
             logger.error(f"Network error during API request: {e}")
@@ -78,13 +181,66 @@ class APIClient:
             logger.error(f"Unexpected error during API request: {e}")
             raise
 
+    def _ttl_get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached endpoint response if it is within that endpoint's TTL.
+
+        Args:
+            key: Endpoint cache key (see _endpoint_ttls)
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._ttl_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._endpoint_ttls[key]:
+            return entry[1]
+        return None
+
+    def _ttl_set(self, key: str, value: Any) -> None:
+        """Store an endpoint response in the TTL cache."""
+        self._ttl_cache[key] = (time.monotonic(), value)
+
+    async def _coalesced(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fetch(), sharing one in-flight call among concurrent callers.
+
+        While a call for key is pending, further callers await the same task
+        instead of issuing their own request. Cancelling one caller does not
+        cancel the shared call for the others.
+
+        Args:
+            key: Identifies the request being deduplicated
+            fetch: Zero-argument coroutine function performing the request
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     async def get_meters(self) -> List[Dict[str, Any]]:
         """
         Fetch all meters associated with the authenticated user.
 
+        Results are cached in memory for the configured discovery TTL, and
+        concurrent calls share a single request.
+
         Returns:
             List of meter objects from the API
         """
+        cached_meters = self._ttl_get("meters")
+        if cached_meters is not None:
+            logger.debug("Using cached meter list")
+            return list(cached_meters)
+
+        return list(await self._coalesced("meters", self._fetch_meters))
+
+    async def _fetch_meters(self) -> List[Dict[str, Any]]:
+        """Request the meter list from the API and refresh the meter cache."""
         logger.info("Fetching available meters from API")
         response = await self._make_request("GET", self.config.discovery_endpoint)
 
@@ -100,33 +256,167 @@ class APIClient:
                     # Ensure we have the required fields
                     if "id" in meter and "name" in meter:
                         meters.append(meter)
+                        self._status_url(meter["id"])
                         logger.debug(f"Found meter: ID={meter['id']}, Name={meter['name']}")
             
             logger.info(f"Successfully discovered {len(meters)} meters")
+            self._ttl_set("meters", meters)
             return meters
         else:
             logger.warning(f"Unexpected discovery response structure: {response}")
             return []
 
-    async def get_meter_status(self, meter_id: str) -> Dict[str, Any]:
+    def invalidate_meters(self) -> None:
+        """Discard the cached meter list so the next discovery hits the API."""
+        self._ttl_cache.pop("meters", None)
+
+    async def get_meter_status(self, meter_id: str, max_age: Optional[float] = None) -> Dict[str, Any]:
         """
         Fetch the current status of a specific meter.
 
+        See poll_meter_status for caching behaviour.
+
         Args:
             meter_id: The ID of the meter to query
+            max_age: Oldest cached status (in seconds) the caller accepts
 
         Returns:
             Meter status data from the API
         """
+        status, _ = await self.poll_meter_status(meter_id, max_age)
+        return status
+
+    async def poll_meter_status(self, meter_id: str,
+                                max_age: Optional[float] = None) -> Tuple[Dict[str, Any], str]:
+        """
+        Fetch the current status of a specific meter, reporting where it came from.
+
+        Responses are cached briefly (longer for meters that have been idle,
+        see record_activity); if the request fails and fallback is
+        enabled, the last known status is returned instead. When the API sent
+        an ETag and status_method is GET or HEAD, polls are conditional and a
+        304 reuses the previous status.
+        Concurrent calls for the same meter share a single request.
+
+        Args:
+            meter_id: The ID of the meter to query
+            max_age: Oldest cached status (in seconds) the caller accepts,
+                overriding the meter's current TTL; 0 always issues a fresh
+                request of its own
+
+        Returns:
+            Tuple of (meter status data, source), where source is SOURCE_API
+            for a status fetched from the API, SOURCE_CACHE for a cache hit
+            and SOURCE_FALLBACK for the last known status served after a
+            failed request
+        """
+        cache_key = f"meter:status:{meter_id}"
+        if max_age is None:
+            ttl_state = self._ttl_state.get(meter_id)
+            max_age = ttl_state[1] if ttl_state else self.config.status_ttl_seconds
+        elif max_age <= 0:
+            return await self._fetch_meter_status(meter_id, cache_key)
+
+        cached = self._status_cache.get(cache_key, max_age)
+        if cached is not None:
+            logger.debug(f"Using cached status for meter {meter_id}")
+            return cached, SOURCE_CACHE
+
+        return await self._coalesced(cache_key, lambda: self._fetch_meter_status(meter_id, cache_key))
+
+    async def _fetch_meter_status(self, meter_id: str, cache_key: str) -> Tuple[Dict[str, Any], str]:
+        """Request a meter's status from the API, refresh its cache entry and record its activity."""
         logger.debug(f"Fetching status for meter {meter_id}")
-        response = await self._make_request(self.config.status_method, f"/merchant/meter/{meter_id}/sync-status")
+        endpoint = self._status_url(meter_id)
+        try:
+            response = await self._make_request(self.config.status_method, endpoint, etag_key=meter_id)
+            if response is STATUS_UNCHANGED:
+                unchanged = self._status_cache.get_stale(cache_key)
+                if unchanged is not None:
+                    logger.debug(f"Status for meter {meter_id} not modified")
+                    self._status_cache.set(cache_key, unchanged)
+                    self.record_activity(meter_id, False)
+                    return unchanged, SOURCE_API
+            if response is STATUS_UNCHANGED or response is PRECONDITION_FAILED:
+                # Nothing to reuse, or the server refused the conditional request,
+                # so repeat the request unconditionally
+                self._etags.pop(meter_id, None)
+                response = await self._make_request(self.config.status_method, endpoint, etag_key=meter_id)
+                if response is STATUS_UNCHANGED or response is PRECONDITION_FAILED:
+                    raise aiohttp.ClientError(f"Unconditional status request for meter {meter_id} returned no body")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if self.config.cache_fallback_enabled:
+                stale = self._status_cache.get_stale(cache_key)
+                if stale is not None:
+                    logger.warning(f"Status request for meter {meter_id} failed ({e!r}) - using last known status")
+                    return stale, SOURCE_FALLBACK
+            raise
 
         # Handle nested response structure: data -> meter data
         if "data" in response and isinstance(response["data"], dict):
-            return response["data"]
+            response = response["data"]
+
+        previous = self._status_cache.get_stale(cache_key)
+        self.record_activity(
+            meter_id,
+            previous is None or any(previous.get(key) != response.get(key) for key in _ACTIVITY_KEYS)
+        )
+        self._status_cache.set(cache_key, response)
+        return response, SOURCE_API
+
+    async def get_meter_statuses(self, meter_ids: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """
+        Fetch the status of several meters concurrently.
+
+        At most config.max_concurrency requests are in flight at once.
+
+        Args:
+            meter_ids: The IDs of the meters to query
+
+        Returns:
+            Dictionary mapping each meter ID to its status data, or to the
+            exception raised while fetching it
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def fetch_one(meter_id: str) -> Tuple[str, Union[Dict[str, Any], Exception]]:
+            async with semaphore:
+                try:
+                    return meter_id, await self.get_meter_status(meter_id)
+                except Exception as e:
+                    logger.error(f"Failed to fetch status for meter {meter_id}: {e}")
+                    return meter_id, e
+
+        return dict(await asyncio.gather(*(fetch_one(meter_id) for meter_id in meter_ids)))
+
+    def record_activity(self, meter_id: str, changed: bool) -> None:
+        """
+        Adapt the status cache TTL for a meter to its observed activity.
+
+        Called for every status fetched from the API; statuses served from the
+        cache say nothing new and are not counted. After
+        IDLE_POLLS_BEFORE_BACKOFF polls without any reading or balance
+        change, the TTL doubles on each further idle poll up to
+        config.max_interval_seconds. Any change snaps it back to the base TTL.
+
+        Args:
+            meter_id: The meter identifier
+            changed: Whether the reading or balance differs from the previous fetch
+        """
+        base_ttl = self.config.status_ttl_seconds
+        if changed:
+            self._ttl_state[meter_id] = (0, base_ttl)
+            return
+
+        idle_polls, ttl = self._ttl_state.get(meter_id, (0, base_ttl))
+        idle_polls += 1
+        if idle_polls > IDLE_POLLS_BEFORE_BACKOFF:
+            ttl = min(ttl * 2, max(self.config.max_interval_seconds, base_ttl))
+        self._ttl_state[meter_id] = (idle_polls, ttl)
 
-        # Fallback for direct response
-        return response
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get hit/miss counters for the meter status cache."""
+        return self._status_cache.get_stats()
 
     async def get_meter_transactions(self, meter_id: str, date_from: str, date_to: str) -> Dict[str, Any]:
         """
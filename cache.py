@@ -0,0 +1,96 @@
+"""
+Response cache module for the electricity meter monitoring system.
+
+This module provides a small in-process TTL cache for API responses, with
+access to stale entries so callers can fall back to the last known value
+when the upstream API is unreachable.
+"""
+
+import logging
+import time
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    In-memory TTL cache keyed by string, tracking hit/miss counters.
+
+    Entries are never evicted on expiry so that stale values remain available
+    for fallback; they are simply overwritten by the next successful response.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None) -> Optional[Any]:
+        """
+        Get a cached value if it is still fresh.
+
+        Args:
+            key: Cache key
+            ttl_seconds: Override for the default TTL
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return None
+
+    def get_stale(self, key: str) -> Optional[Any]:
+        """
+        Get the last stored value regardless of its age.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The last cached value, or None if nothing was ever stored
+        """
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Remove one entry, or all entries if no key is given.
+
+        Args:
+            key: Cache key to remove (optional)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache hit/miss counters.
+
+        Returns:
+            Dictionary with hit, miss and entry counts
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries)
+        }
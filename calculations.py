@@ -7,11 +7,15 @@ units or performing conversions.
 """
 
 import logging
-from typing import Optional, Dict, Any
-from data_model import MeterSnapshot
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from data_model import MeterSnapshot, SnapshotSeries
 
 logger = logging.getLogger(__name__)
 
+# Deltas larger than this (in either direction) are flagged as extreme (arbitrary threshold)
+EXTREME_DELTA_THRESHOLD = 1000
+
 
 class MeterCalculations:
     """
@@ -33,6 +37,12 @@ class MeterCalculations:
         Returns:
             The delta value, or None if computation is not possible
         """
+        # Fast path: values normalized by MeterSnapshot are already float or None
+        if type(current_value) is float and type(previous_value) is float:
+            return current_value - previous_value
+        if current_value is None or previous_value is None:
+            return None
+
         try:
             # Only compute delta if both values are numeric
             if isinstance(current_value, (int, float)) and isinstance(previous_value, (int, float)):
@@ -54,6 +64,12 @@ class MeterCalculations:
         Returns:
             The delta value, or None if computation is not possible
         """
+        # Fast path: values normalized by MeterSnapshot are already float or None
+        if type(current_balance) is float and type(previous_balance) is float:
+            return current_balance - previous_balance
+        if current_balance is None or previous_balance is None:
+            return None
+
         try:
             # Only compute delta if both values are numeric
             if isinstance(current_balance, (int, float)) and isinstance(previous_balance, (int, float)):
@@ -117,24 +133,24 @@ class MeterCalculations:
         # Check for extreme delta values (arbitrarily large changes)
         if snapshot.current_reading_delta is not None:
             # Flag if delta is more than 1000 units (arbitrary threshold)
-            if abs(snapshot.current_reading_delta) > 1000:
+            if abs(snapshot.current_reading_delta) > EXTREME_DELTA_THRESHOLD:
                 anomalies["extreme_reading_delta"] = {
                     "delta": snapshot.current_reading_delta,
-                    "threshold": 1000
+                    "threshold": EXTREME_DELTA_THRESHOLD
                 }
 
         if snapshot.balance_unit_delta is not None:
             # Flag if balance changes by more than 1000 units
-            if abs(snapshot.balance_unit_delta) > 1000:
+            if abs(snapshot.balance_unit_delta) > EXTREME_DELTA_THRESHOLD:
                 anomalies["extreme_balance_delta"] = {
                     "delta": snapshot.balance_unit_delta,
-                    "threshold": 1000
+                    "threshold": EXTREME_DELTA_THRESHOLD
                 }
 
         # Check for connectivity changes
         if previous_snapshot:
-            current_online = snapshot.is_online()
-            previous_online = previous_snapshot.is_online()
+            current_online = snapshot.is_online
+            previous_online = previous_snapshot.is_online
             if current_online != previous_online:
                 anomalies["connectivity_change"] = {
                     "from": previous_online,
@@ -143,6 +159,53 @@ class MeterCalculations:
 
         return anomalies
 
+    @staticmethod
+    def detect_anomalies_series(series: SnapshotSeries) -> Dict[str, List[int]]:
+        """
+        Detect anomalies across a whole snapshot series in one pass.
+
+        Applies the same checks as detect_anomalies, comparing each snapshot to
+        the one before it. Failed polls are skipped and never used as a baseline.
+
+        Args:
+            series: Column view of the snapshots, oldest first
+
+        Returns:
+            Dictionary mapping each anomaly type to the series indices where it occurs
+        """
+        anomalies = {
+            "non_monotonic_reading": [],
+            "extreme_reading_delta": [],
+            "extreme_balance_delta": [],
+            "connectivity_change": []
+        }
+
+        previous_index = None
+        for i, ok in enumerate(series.ok):
+            if not ok:
+                continue
+
+            reading_delta = series.reading_deltas[i]
+            if reading_delta is not None and abs(reading_delta) > EXTREME_DELTA_THRESHOLD:
+                anomalies["extreme_reading_delta"].append(i)
+
+            balance_delta = series.balance_deltas[i]
+            if balance_delta is not None and abs(balance_delta) > EXTREME_DELTA_THRESHOLD:
+                anomalies["extreme_balance_delta"].append(i)
+
+            if previous_index is not None:
+                reading = series.readings[i]
+                previous_reading = series.readings[previous_index]
+                if reading is not None and previous_reading is not None and reading < previous_reading:
+                    anomalies["non_monotonic_reading"].append(i)
+
+                if series.online[i] != series.online[previous_index]:
+                    anomalies["connectivity_change"].append(i)
+
+            previous_index = i
+
+        return anomalies
+
     @staticmethod
     def compute_statistics(meter_id: str, snapshots: list[MeterSnapshot]) -> Dict[str, Any]:
         """
@@ -158,57 +221,60 @@ class MeterCalculations:
         if not snapshots:
             return {"meter_id": meter_id, "error": "No snapshots provided"}
 
-        successful_snapshots = [s for s in snapshots if s.poll_successful]
+        # Project the successful snapshots into flat value columns once
+        series = SnapshotSeries.from_snapshots(s for s in snapshots if s.poll_successful)
 
-        if not successful_snapshots:
+        if not len(series):
             return {"meter_id": meter_id, "error": "No successful snapshots"}
 
         stats = {
             "meter_id": meter_id,
             "total_snapshots": len(snapshots),
-            "successful_snapshots": len(successful_snapshots),
-            "success_rate": len(successful_snapshots) / len(snapshots),
+            "successful_snapshots": len(series),
+            "success_rate": len(series) / len(snapshots),
             "time_range": {
-                "start": min(s.local_timestamp for s in successful_snapshots),
-                "end": max(s.local_timestamp for s in successful_snapshots)
+                "start": datetime.fromtimestamp(min(series.timestamps)),
+                "end": datetime.fromtimestamp(max(series.timestamps))
             }
         }
 
         # Reading statistics
-        readings = [s.get_current_reading() for s in successful_snapshots if s.get_current_reading() is not None]
+        readings = [r for r in series.readings if r is not None]
         if readings:
             stats["reading_stats"] = {
                 "min": min(readings),
                 "max": max(readings),
-                "current": readings[-1] if readings else None
+                "current": readings[-1]
             }
 
         # Balance statistics
-        balances = [s.get_balance_unit() for s in successful_snapshots if s.get_balance_unit() is not None]
+        balances = [b for b in series.balances if b is not None]
         if balances:
             stats["balance_stats"] = {
                 "min": min(balances),
                 "max": max(balances),
-                "current": balances[-1] if balances else None
+                "current": balances[-1]
             }
 
         # Delta statistics
-        reading_deltas = [s.current_reading_delta for s in successful_snapshots if s.current_reading_delta is not None]
+        reading_deltas = [d for d in series.reading_deltas if d is not None]
         if reading_deltas:
+            total_change = sum(reading_deltas)
             stats["reading_delta_stats"] = {
-                "total_change": sum(reading_deltas),
-                "average_change": sum(reading_deltas) / len(reading_deltas),
+                "total_change": total_change,
+                "average_change": total_change / len(reading_deltas),
                 "min_delta": min(reading_deltas),
                 "max_delta": max(reading_deltas)
             }
 
-        balance_deltas = [s.balance_unit_delta for s in successful_snapshots if s.balance_unit_delta is not None]
+        balance_deltas = [d for d in series.balance_deltas if d is not None]
         if balance_deltas:
+            total_change = sum(balance_deltas)
             stats["balance_delta_stats"] = {
-                "total_change": sum(balance_deltas),
-                "average_change": sum(balance_deltas) / len(balance_deltas),
+                "total_change": total_change,
+                "average_change": total_change / len(balance_deltas),
                 "min_delta": min(balance_deltas),
                 "max_delta": max(balance_deltas)
             }
 
-        return stats
\ No newline at end of file
+        return stats
@@ -5,13 +5,38 @@ This module is responsible for loading configuration from config.json,
 validating required fields, and providing a centralized configuration object.
 """
 
-import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+import serialization
+
+# Paths of settings that must be present and non-empty
+_REQUIRED_FIELDS: Tuple[Tuple[str, ...], ...] = (
+    ("api", "base_url"),
+    ("api", "merchant_token"),
+    ("api", "user_agent"),
+    ("api", "origin"),
+    ("api", "referer"),
+    ("polling", "interval_seconds"),
+    ("database", "path"),
+    ("logging", "level"),
+)
 
 
 class Config:
-    """Configuration class that loads and validates settings from config.json."""
+    """
+    Configuration class that loads and validates settings from config.json.
+
+    Validated settings are exposed as plain attributes (api_base_url,
+    merchant_token, polling_interval, database_path, ...).
+    """
+
+    __slots__ = (
+        "config_path", "_config",
+        "api_base_url", "merchant_token", "user_agent", "origin", "referer",
+        "discovery_endpoint", "discovery_ttl_seconds", "status_method", "max_concurrency",
+        "polling_interval", "max_interval_seconds", "status_ttl_seconds", "cache_fallback_enabled",
+        "database_path", "compress_raw_data", "log_level", "log_file", "manual_meter_ids",
+    )
 
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
@@ -23,94 +48,63 @@ class Config:
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            self._config = json.load(f)
+        # Read raw bytes and let the JSON decoder handle UTF-8 directly
+        with open(self.config_path, 'rb') as f:
+            self._config = serialization.loads(f.read())
 
         self.validate_config()
+        self._flatten_config()
 
     def validate_config(self) -> None:
         """Validate that all required configuration fields are present."""
-        required_fields = [
-            "api.base_url",
-            "api.merchant_token",
-            "api.user_agent",
-            "api.origin",
-            "api.referer",
-            "polling.interval_seconds",
-            "database.path",
-            "logging.level"
-        ]
-
-        for field in required_fields:
-            keys = field.split('.')
+        for path in _REQUIRED_FIELDS:
             value = self._config
             try:
-                for key in keys:
+                for key in path:
                     value = value[key]
                 if value is None or (isinstance(value, str) and not value.strip()):
-                    raise ValueError(f"Required field '{field}' is empty or null")
+                    raise ValueError(f"Required field '{'.'.join(path)}' is empty or null")
             except (KeyError, TypeError):
-                raise ValueError(f"Required field '{field}' is missing from configuration")
-
-    @property
-    def api_base_url(self) -> str:
-        """Get the API base URL."""
-        return self._config["api"]["base_url"]
-
-    @property
-    def merchant_token(self) -> str:
-        """Get the merchant authentication token."""
-        return self._config["api"]["merchant_token"]
-
-    @property
-    def user_agent(self) -> str:
-        """Get the user agent string."""
-        return self._config["api"]["user_agent"]
-
-    @property
-    def origin(self) -> str:
-        """Get the origin header value."""
-        return self._config["api"]["origin"]
-
-    @property
-    def referer(self) -> str:
-        """Get the referer header value."""
-        return self._config["api"]["referer"]
-
-    @property
-    def discovery_endpoint(self) -> str:
-        """Get the API endpoint for meter discovery."""
-        return self._config["api"].get("discovery_endpoint", "/merchant/meters")
-
-    @property
-    def status_method(self) -> str:
-        """Get the HTTP method for meter status requests."""
-        return self._config["api"].get("status_method", "GET")
-
-    @property
-    def polling_interval(self) -> int:
-        """Get the polling interval in seconds."""
-        return self._config["polling"]["interval_seconds"]
-
-    @property
-    def database_path(self) -> str:
-        """Get the database file path."""
-        return self._config["database"]["path"]
-
-    @property
-    def log_level(self) -> str:
-        """Get the logging level."""
-        return self._config["logging"]["level"]
-
-    @property
-    def log_file(self) -> str:
-        """Get the log file path (optional)."""
-        return self._config.get("logging", {}).get("file")
-
-    @property
-    def manual_meter_ids(self) -> list[str]:
-        """Get manually configured meter IDs."""
-        return self._config.get("meters", {}).get("manual_ids", [])
+                raise ValueError(f"Required field '{'.'.join(path)}' is missing from configuration")
+
+    def _flatten_config(self) -> None:
+        """
+        Copy validated settings into plain attributes.
+
+        The configuration is immutable at runtime, so resolving every nested
+        lookup once here turns each setting access into a single attribute read.
+        """
+        api = self._config["api"]
+        cache = self._config.get("cache", {})
+        logging_config = self._config.get("logging", {})
+
+        # API settings
+        self.api_base_url: str = api["base_url"]
+        self.merchant_token: str = api["merchant_token"]
+        self.user_agent: str = api["user_agent"]
+        self.origin: str = api["origin"]
+        self.referer: str = api["referer"]
+        self.discovery_endpoint: str = api.get("discovery_endpoint", "/merchant/meters")
+        self.discovery_ttl_seconds: float = api.get("discovery_ttl_seconds", 600)
+        self.status_method: str = api.get("status_method", "GET").upper()
+        self.max_concurrency: int = api.get("max_concurrency", 10)
+
+        # Polling and caching
+        self.polling_interval: int = self._config["polling"]["interval_seconds"]
+        self.status_ttl_seconds: float = cache.get("status_ttl_seconds", 5)
+        # Upper bound for the adaptive status TTL; defaults to no growth
+        self.max_interval_seconds: float = self._config["polling"].get("max_interval_seconds",
+                                                                         self.status_ttl_seconds)
+        self.cache_fallback_enabled: bool = cache.get("fallback_enabled", False)
+
+        # Storage and logging
+        self.database_path: str = self._config["database"]["path"]
+        self.compress_raw_data: bool = self._config["database"].get("compress_raw_data", False)
+        self.log_level: str = logging_config["level"]
+        self.log_file: Optional[str] = logging_config.get("file")
+
+        # Meters
+        self.manual_meter_ids: List[str] = self._config.get("meters", {}).get("manual_ids", [])
 
     def get_raw_config(self) -> Dict[str, Any]:
         """Get the raw configuration dictionary."""
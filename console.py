@@ -0,0 +1,65 @@
+"""
+Console input module for the electricity meter monitoring system.
+
+This module runs blocking interactive prompts off the event loop thread so
+that background tasks keep running while the user is typing.
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Optional
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException] = None) -> None:
+    """Complete a future from the loop thread unless its awaiter has gone away."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def run_interactive(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking interactive function in a background thread and await its result.
+
+    A daemon thread is used instead of the default executor: a prompt still
+    waiting on input() must not keep the interpreter alive after Ctrl+C.
+
+    Args:
+        func: Function that reads from stdin (e.g. input)
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns; exceptions raised by func are re-raised here
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def worker() -> None:
+        try:
+            result, error = func(*args), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve, future, result, error)
+        except RuntimeError:
+            # The event loop already closed; nobody is waiting for the answer
+            pass
+
+    threading.Thread(target=worker, name="console-input", daemon=True).start()
+    return await future
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Asynchronous equivalent of input().
+
+    Args:
+        prompt: Text written before reading
+
+    Returns:
+        The line read from stdin, without the trailing newline
+    """
+    return await run_interactive(input, prompt)
@@ -4,12 +4,79 @@ Data model module for the electricity meter monitoring system.
 This module defines structured representations of meter snapshots and related data.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+import sys
+import time
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, Optional, Iterable, List, Tuple
 from datetime import datetime
+import serialization
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Every possible connectivity label, keyed by (is_online, is_connected)
+_CONNECTIVITY_LABELS = {
+    (online, connected): f"{'ONLINE' if online else 'OFFLINE'} - {'CONNECTED' if connected else 'DISCONNECTED'}"
+    for online in (False, True)
+    for connected in (False, True)
+}
+
+
+# Snapshot attributes copied verbatim from the API response, as (attribute, response key)
+_FIELD_MAP = (
+    ("meter_name", "name"),
+    ("vendor_meter_id", "vendor_meter_id"),
+    ("api_timestamp", "updated_at"),
+    ("last_connected_at", "last_connected_at"),
+    # Financial data
+    ("currency", "currency"),
+    ("unit_price", "unit_price"),
+    ("minimum_topup_unit", "minimum_topup_unit"),
+    ("minimum_topup_price", "minimum_topup_price"),
+    ("free_unit", "free_unit"),
+    ("free_unit_refresh_at", "free_unit_refresh_at"),
+    # Balance alerts
+    ("warning_at_unit", "warning_at_unit"),
+    ("is_low_balance_notification_sent", "is_low_balance_notification_sent"),
+    # Status
+    ("is_online", "is_online"),
+    ("is_connected", "is_connected"),
+    ("is_active", "is_active"),
+)
+
+
+def _intern_id(meter_id: Any) -> Any:
+    """Intern string meter IDs so every snapshot and dict key shares one object."""
+    return sys.intern(meter_id) if type(meter_id) is str else meter_id
+
+
+def _coerce_numeric(value: Any) -> Optional[float]:
+    """Convert a numeric API value to float, or None if it is not numeric."""
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def compute_deltas(previous_reading: Optional[float], previous_balance: Optional[float],
+                   reading: Optional[float], balance: Optional[float]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Compute reading and balance deltas from normalized snapshot values.
+
+    Args:
+        previous_reading: Reading from the previous snapshot
+        previous_balance: Balance from the previous snapshot
+        reading: Current reading
+        balance: Current balance
+
+    Returns:
+        Tuple of (reading delta, balance delta); each is None if either side is missing
+    """
+    return (
+        reading - previous_reading if reading is not None and previous_reading is not None else None,
+        balance - previous_balance if balance is not None and previous_balance is not None else None,
+    )
+
+
+@dataclass(**_SLOTS)
 class MeterSnapshot:
     """
     Represents a complete snapshot of meter data at a specific point in time.
@@ -22,14 +89,16 @@ class MeterSnapshot:
     vendor_meter_id: Optional[int] = None
 
     # Timestamp information
-    local_timestamp: datetime = field(default_factory=datetime.now)
+    local_timestamp: float = field(default_factory=time.time)  # Epoch seconds, formatted on write
     api_timestamp: Optional[str] = None
     last_connected_at: Optional[str] = None
 
     # Raw meter data from API (all fields stored verbatim)
     raw_data: Dict[str, Any] = field(default_factory=dict)
 
-    # Energy & Balance data
+    # Energy & Balance data (numeric values normalized from raw_data)
+    current_reading: Optional[float] = None
+    balance_unit: Optional[float] = None
     current_reading_delta: Optional[float] = None
     balance_unit_delta: Optional[float] = None
 
@@ -56,39 +125,30 @@ class MeterSnapshot:
 
     @classmethod
     def from_api_response(cls, meter_id: str, api_response: Dict[str, Any],
-                         previous_snapshot: Optional['MeterSnapshot'] = None) -> 'MeterSnapshot':
+                         previous_snapshot: Optional['MeterSnapshot'] = None,
+                         copy_raw: bool = False) -> 'MeterSnapshot':
         """
         Create a MeterSnapshot from API response data.
 
+        The response dict is stored as raw_data by reference unless copy_raw is
+        set, so callers must not mutate it after building the snapshot.
+
         Args:
             meter_id: The meter identifier
             api_response: Raw response from the API
             previous_snapshot: Previous snapshot for delta calculation
+            copy_raw: Store a shallow copy of the response instead of the original
 
         Returns:
             New MeterSnapshot instance
         """
         snapshot = cls(
-            meter_id=meter_id,
-            meter_name=api_response.get("name"),
-            vendor_meter_id=api_response.get("vendor_meter_id"),
-            api_timestamp=api_response.get("updated_at"),
-            last_connected_at=api_response.get("last_connected_at"),
-            raw_data=api_response.copy(),
-            # Financial data
-            currency=api_response.get("currency"),
-            unit_price=api_response.get("unit_price"),
-            minimum_topup_unit=api_response.get("minimum_topup_unit"),
-            minimum_topup_price=api_response.get("minimum_topup_price"),
-            free_unit=api_response.get("free_unit"),
-            free_unit_refresh_at=api_response.get("free_unit_refresh_at"),
-            # Balance alerts
-            warning_at_unit=api_response.get("warning_at_unit"),
-            is_low_balance_notification_sent=api_response.get("is_low_balance_notification_sent"),
-            # Status
-            is_online=api_response.get("is_online"),
-            is_connected=api_response.get("is_connected"),
-            is_active=api_response.get("is_active"),
+            meter_id=_intern_id(meter_id),
+            raw_data=api_response.copy() if copy_raw else api_response,
+            # Numeric values are normalized to float so deltas need no type checks
+            current_reading=_coerce_numeric(api_response.get("current_reading")),
+            balance_unit=_coerce_numeric(api_response.get("balance_unit")),
+            **{attr: api_response.get(key) for attr, key in _FIELD_MAP}
         )
 
         # Compute deltas if we have a previous snapshot
@@ -110,7 +170,7 @@ class MeterSnapshot:
             Error MeterSnapshot instance
         """
         return cls(
-            meter_id=meter_id,
+            meter_id=_intern_id(meter_id),
             poll_successful=False,
             error_message=error_message
         )
@@ -122,39 +182,33 @@ class MeterSnapshot:
         Args:
             previous: The previous meter snapshot
         """
-        # Compute delta for current_reading if both values are numeric
-        current_reading = self.raw_data.get("current_reading")
-        prev_reading = previous.raw_data.get("current_reading")
-
-        if isinstance(current_reading, (int, float)) and isinstance(prev_reading, (int, float)):
-            self.current_reading_delta = current_reading - prev_reading
-
-        # Compute delta for balance_unit if both values are numeric
-        balance_unit = self.raw_data.get("balance_unit")
-        prev_balance = previous.raw_data.get("balance_unit")
-
-        if isinstance(balance_unit, (int, float)) and isinstance(prev_balance, (int, float)):
-            self.balance_unit_delta = balance_unit - prev_balance
+        # Both values were normalized to float (or None) at construction time
+        self.current_reading_delta, self.balance_unit_delta = compute_deltas(
+            previous.current_reading, previous.balance_unit, self.current_reading, self.balance_unit
+        )
 
     def get_current_reading(self) -> Optional[float]:
         """Get the current reading value."""
-        value = self.raw_data.get("current_reading")
-        return float(value) if isinstance(value, (int, float)) else None
+        return self.current_reading
 
     def get_balance_unit(self) -> Optional[float]:
         """Get the balance unit value."""
-        value = self.raw_data.get("balance_unit")
-        return float(value) if isinstance(value, (int, float)) else None
+        return self.balance_unit
+
+    def get_local_datetime(self) -> datetime:
+        """Get the local poll time as a datetime."""
+        return datetime.fromtimestamp(self.local_timestamp)
+
+    def get_local_timestamp_iso(self) -> str:
+        """Get the local poll time as an ISO 8601 string."""
+        return datetime.fromtimestamp(self.local_timestamp).isoformat()
 
     def get_connectivity_status(self) -> str:
         """Get a human-readable connectivity status."""
         if not self.poll_successful:
             return "OFFLINE (poll failed)"
-        
-        online_status = "ONLINE" if self.is_online else "OFFLINE"
-        connected_status = "CONNECTED" if self.is_connected else "DISCONNECTED"
-        
-        return f"{online_status} - {connected_status}"
+
+        return _CONNECTIVITY_LABELS[bool(self.is_online), bool(self.is_connected)]
 
     def get_cost_estimate(self) -> Optional[float]:
         """Calculate estimated cost for current reading based on unit price."""
@@ -174,35 +228,131 @@ class MeterSnapshot:
             return balance * price
         return None
 
-    def to_dict(self) -> Dict[str, Any]:
+    @classmethod
+    def _build_to_dict(cls) -> None:
+        """
+        Generate and install to_dict() for this class.
+
+        The method body is a single dict literal over all dataclass fields,
+        built once at import time, so each call avoids fields()/asdict()
+        traversal and per-key dict insertion.
         """
+        items = []
+        for name in cls.__field_names__:
+            if name == "local_timestamp":
+                items.append(f'"{name}": self.get_local_timestamp_iso()')
+            else:
+                items.append(f'"{name}": self.{name}')
+        # Connectivity is inlined as a lookup into the precomputed label table
+        items.append(
+            '"connectivity_status": _CONNECTIVITY_LABELS[bool(self.is_online), bool(self.is_connected)]'
+            ' if self.poll_successful else "ERROR"'
+        )
+
+        source = "def to_dict(self):\n    return {" + ", ".join(items) + "}\n"
+        namespace: Dict[str, Any] = {"_CONNECTIVITY_LABELS": _CONNECTIVITY_LABELS}
+        exec(source, namespace)
+
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+        to_dict.__doc__ = """
         Convert the snapshot to a dictionary for database storage.
 
         Returns:
             Dictionary representation suitable for database insertion
         """
-        return {
-            "meter_id": self.meter_id,
-            "meter_name": self.meter_name,
-            "vendor_meter_id": self.vendor_meter_id,
-            "local_timestamp": self.local_timestamp.isoformat(),
-            "api_timestamp": self.api_timestamp,
-            "last_connected_at": self.last_connected_at,
-            "raw_data": self.raw_data,
-            "current_reading_delta": self.current_reading_delta,
-            "balance_unit_delta": self.balance_unit_delta,
-            "currency": self.currency,
-            "unit_price": self.unit_price,
-            "minimum_topup_unit": self.minimum_topup_unit,
-            "minimum_topup_price": self.minimum_topup_price,
-            "free_unit": self.free_unit,
-            "free_unit_refresh_at": self.free_unit_refresh_at,
-            "warning_at_unit": self.warning_at_unit,
-            "is_low_balance_notification_sent": self.is_low_balance_notification_sent,
-            "is_online": self.is_online,
-            "is_connected": self.is_connected,
-            "is_active": self.is_active,
-            "poll_successful": self.poll_successful,
-            "error_message": self.error_message,
-            "connectivity_status": self.get_connectivity_status() if self.poll_successful else "ERROR"
-        }
\ No newline at end of file
+        cls.to_dict = to_dict
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the snapshot to compact JSON bytes.
+
+        Returns:
+            UTF-8 encoded JSON representation of to_dict()
+        """
+        return serialization.dumps_bytes(self.to_dict())
+
+
+# Field names resolved once; use these instead of calling dataclasses.fields() per instance
+_SNAPSHOT_FIELD_NAMES = tuple(f.name for f in fields(MeterSnapshot))
+MeterSnapshot.__field_names__ = _SNAPSHOT_FIELD_NAMES
+MeterSnapshot._build_to_dict()
+
+
+@dataclass
+class SnapshotSeries:
+    """
+    Column-oriented view over a sequence of meter snapshots.
+
+    Each attribute is a list with one entry per snapshot, in the original order,
+    so statistics and anomaly scans can work on flat value lists instead of
+    re-reading attributes and raw_data off every snapshot object.
+    """
+    timestamps: List[float] = field(default_factory=list)
+    readings: List[Optional[float]] = field(default_factory=list)
+    balances: List[Optional[float]] = field(default_factory=list)
+    reading_deltas: List[Optional[float]] = field(default_factory=list)
+    balance_deltas: List[Optional[float]] = field(default_factory=list)
+    online: List[Optional[bool]] = field(default_factory=list)
+    ok: List[bool] = field(default_factory=list)
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[MeterSnapshot]) -> 'SnapshotSeries':
+        """
+        Build a series from snapshots in a single pass.
+
+        Args:
+            snapshots: Snapshots to project, oldest first
+
+        Returns:
+            New SnapshotSeries instance
+        """
+        series = cls()
+        for snapshot in snapshots:
+            series.timestamps.append(snapshot.local_timestamp)
+            series.readings.append(snapshot.get_current_reading())
+            series.balances.append(snapshot.get_balance_unit())
+            series.reading_deltas.append(snapshot.current_reading_delta)
+            series.balance_deltas.append(snapshot.balance_unit_delta)
+            series.online.append(snapshot.is_online)
+            series.ok.append(snapshot.poll_successful)
+        return series
+
+    def __len__(self) -> int:
+        return len(self.ok)
+
+
+@dataclass(**_SLOTS)
+class TransactionRecord:
+    """
+    A single meter transaction, reduced to the fields used for analysis and display.
+
+    Amounts are converted to float once, when the record is built from the API data.
+    """
+    key: str
+    tx_type: str
+    amount: float
+    units: float
+    created_at: Optional[str] = None
+    status: Optional[int] = None
+
+    @classmethod
+    def from_api_response(cls, key: str, tx: Dict[str, Any]) -> 'TransactionRecord':
+        """
+        Create a TransactionRecord from one transaction returned by the API.
+
+        Args:
+            key: The transaction's key in the API response
+            tx: Raw transaction data
+
+        Returns:
+            New TransactionRecord instance
+        """
+        return cls(
+            key=key,
+            tx_type=tx.get("type", "UNKNOWN"),
+            amount=float(tx.get("total_price", 0)),
+            units=float(tx.get("unit", 0)),
+            created_at=tx.get("created_at"),
+            status=tx.get("status"),
+        )
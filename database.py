@@ -6,15 +6,86 @@ and data persistence in an append-only fashion suitable for evidence collection.
 """
 
 import sqlite3
-import json
 import logging
-from typing import Dict, Any, List, Optional
+import zlib
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from data_model import MeterSnapshot
 from config import Config
+import serialization
 
 logger = logging.getLogger(__name__)
 
+# zlib level for compressed raw_data; higher levels gain little on small JSON documents
+_RAW_DATA_COMPRESSION_LEVEL = 6
+
+_INSERT_SNAPSHOT_SQL = '''
+    INSERT INTO meter_snapshots (
+        meter_id, meter_name, local_timestamp, api_timestamp,
+        raw_data, current_reading_delta, balance_unit_delta,
+        poll_successful, error_message, is_online
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _decode_raw_data(value: Any) -> Dict[str, Any]:
+    """Decode a stored raw_data value written as JSON text or compressed BLOB."""
+    if not value:
+        return {}
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return serialization.loads(value)
+
+
+class StoredSnapshot:
+    """
+    A meter_snapshots row read back from the database.
+
+    The raw_data column is decoded only when first accessed, so callers that
+    only look at deltas or status columns never pay for JSON parsing. Rows
+    also support dict-style access (row["meter_id"]) for existing callers.
+    """
+
+    __slots__ = (
+        "id", "meter_id", "meter_name", "local_timestamp", "api_timestamp",
+        "current_reading_delta", "balance_unit_delta", "poll_successful",
+        "error_message", "is_online", "_raw_value", "_raw_data"
+    )
+
+    _KEYS = (
+        "id", "meter_id", "meter_name", "local_timestamp", "api_timestamp", "raw_data",
+        "current_reading_delta", "balance_unit_delta", "poll_successful",
+        "error_message", "is_online"
+    )
+
+    def __init__(self, row: Tuple[Any, ...]):
+        (self.id, self.meter_id, self.meter_name, self.local_timestamp, self.api_timestamp,
+         self._raw_value, self.current_reading_delta, self.balance_unit_delta,
+         self.poll_successful, self.error_message, self.is_online) = row
+        self._raw_data: Optional[Dict[str, Any]] = None
+
+    @property
+    def raw_data(self) -> Dict[str, Any]:
+        """Get the decoded raw API data, decoding it on first access."""
+        if self._raw_data is None:
+            self._raw_data = _decode_raw_data(self._raw_value)
+            self._raw_value = None
+        return self._raw_data
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the row to a plain dictionary, decoding raw_data.
+
+        Returns:
+            Dictionary with one entry per selected column
+        """
+        return {key: getattr(self, key) for key in self._KEYS}
+
 
 class MeterDatabase:
     """
@@ -26,18 +97,36 @@ class MeterDatabase:
     def __init__(self, config: Config):
         self.config = config
         self.db_path = config.database_path
+        self.compress_raw_data = config.compress_raw_data
         self._connection: Optional[sqlite3.Connection] = None
+        self._cursor: Optional[sqlite3.Cursor] = None
         self._initialize_database()
 
     def _initialize_database(self) -> None:
         """Initialize the database and create tables if they don't exist."""
-        self._connection = sqlite3.connect(self.db_path)
+        # Autocommit mode: single statements commit on their own and batches use
+        # explicit BEGIN/COMMIT, so reads never open an implicit transaction.
+        # Batched writes run on a worker thread, never concurrently with other calls.
+        self._connection = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256,
+                                           check_same_thread=False)
+        self._cursor = self._connection.cursor()
+        self._configure_connection()
         self._create_tables()
         logger.info(f"Database initialized at {self.db_path}")
 
+    def _configure_connection(self) -> None:
+        """Tune SQLite for an append-heavy write workload."""
+        # WAL avoids the rollback-journal double write and lets readers run during writes;
+        # NORMAL sync is durable in WAL mode except against power loss mid-checkpoint
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA temp_store=MEMORY")
+        self._connection.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        self._connection.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+
     def _create_tables(self) -> None:
         """Create the necessary database tables."""
-        cursor = self._connection.cursor()
+        cursor = self._cursor
 
         # Main snapshots table - stores all meter data
         cursor.execute('''
@@ -47,7 +136,7 @@ class MeterDatabase:
                 meter_name TEXT,
                 local_timestamp TEXT NOT NULL,
                 api_timestamp TEXT,
-                raw_data TEXT NOT NULL,  -- JSON string of all raw API data
+                raw_data TEXT NOT NULL,  -- JSON of all raw API data (text, or zlib BLOB if compressed)
                 current_reading_delta REAL,
                 balance_unit_delta REAL,
                 poll_successful BOOLEAN NOT NULL DEFAULT 1,
@@ -63,6 +152,74 @@ class MeterDatabase:
             ON meter_snapshots (meter_id, local_timestamp)
         ''')
 
+        # Per-meter summary of successful polls, maintained by trigger so that
+        # get_meter_summary is a primary-key lookup instead of a table scan
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meter_latest'")
+        summary_exists = cursor.fetchone() is not None
+
+        cursor.execute("BEGIN")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS meter_latest (
+                meter_id TEXT PRIMARY KEY,
+                total_snapshots INTEGER NOT NULL,
+                first_poll TEXT NOT NULL,
+                last_poll TEXT NOT NULL,
+                last_raw_data TEXT,
+                last_reading_delta REAL,
+                last_balance_delta REAL
+            )
+        ''')
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_meter_latest_insert
+            AFTER INSERT ON meter_snapshots
+            WHEN NEW.poll_successful = 1
+            BEGIN
+                INSERT INTO meter_latest (
+                    meter_id, total_snapshots, first_poll, last_poll,
+                    last_raw_data, last_reading_delta, last_balance_delta
+                ) VALUES (
+                    NEW.meter_id, 1, NEW.local_timestamp, NEW.local_timestamp,
+                    NEW.raw_data, NEW.current_reading_delta, NEW.balance_unit_delta
+                )
+                ON CONFLICT(meter_id) DO UPDATE SET
+                    total_snapshots = total_snapshots + 1,
+                    first_poll = MIN(first_poll, excluded.first_poll),
+                    last_poll = MAX(last_poll, excluded.last_poll),
+                    last_raw_data = CASE WHEN excluded.last_poll >= last_poll
+                                         THEN excluded.last_raw_data ELSE last_raw_data END,
+                    last_reading_delta = CASE WHEN excluded.last_poll >= last_poll
+                                              THEN excluded.last_reading_delta ELSE last_reading_delta END,
+                    last_balance_delta = CASE WHEN excluded.last_poll >= last_poll
+                                              THEN excluded.last_balance_delta ELSE last_balance_delta END;
+            END
+        ''')
+
+        if not summary_exists:
+            # Backfill from snapshots recorded before the summary table existed
+            cursor.execute('''
+                INSERT INTO meter_latest (
+                    meter_id, total_snapshots, first_poll, last_poll,
+                    last_raw_data, last_reading_delta, last_balance_delta
+                )
+                SELECT agg.meter_id, agg.total, agg.first_poll, agg.last_poll,
+                       s.raw_data, s.current_reading_delta, s.balance_unit_delta
+                FROM (
+                    SELECT meter_id, COUNT(*) AS total,
+                           MIN(local_timestamp) AS first_poll, MAX(local_timestamp) AS last_poll
+                    FROM meter_snapshots
+                    WHERE poll_successful = 1
+                    GROUP BY meter_id
+                ) AS agg
+                JOIN meter_snapshots AS s ON s.id = (
+                    SELECT id FROM meter_snapshots
+                    WHERE meter_id = agg.meter_id AND poll_successful = 1
+                    ORDER BY local_timestamp DESC
+                    LIMIT 1
+                )
+            ''')
+        cursor.execute("COMMIT")
+
         # Metadata table for system information
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS system_metadata (
@@ -72,7 +229,26 @@ class MeterDatabase:
             )
         ''')
 
-        self._connection.commit()
+    def _encode_raw_data(self, raw_data: Dict[str, Any]) -> Any:
+        """Encode raw API data as JSON text, or as a zlib-compressed BLOB if enabled."""
+        if self.compress_raw_data:
+            return zlib.compress(serialization.dumps_bytes(raw_data), _RAW_DATA_COMPRESSION_LEVEL)
+        return serialization.dumps(raw_data)
+
+    def _snapshot_row(self, snapshot: MeterSnapshot) -> Tuple[Any, ...]:
+        """Build the meter_snapshots insert parameters for a snapshot."""
+        return (
+            snapshot.meter_id,
+            snapshot.meter_name,
+            snapshot.get_local_timestamp_iso(),
+            snapshot.api_timestamp,
+            self._encode_raw_data(snapshot.raw_data),
+            snapshot.current_reading_delta,
+            snapshot.balance_unit_delta,
+            snapshot.poll_successful,
+            snapshot.error_message,
+            snapshot.is_online
+        )
 
     def store_snapshot(self, snapshot: MeterSnapshot) -> int:
         """
@@ -84,77 +260,80 @@ class MeterDatabase:
         Returns:
             The database row ID of the inserted record
         """
-        cursor = self._connection.cursor()
+        cursor = self._cursor
 
-        data = snapshot.to_dict()
+        # Bind attributes directly; building the full to_dict() here is wasted work
+        cursor.execute(_INSERT_SNAPSHOT_SQL, self._snapshot_row(snapshot))
 
-        cursor.execute('''
-            INSERT INTO meter_snapshots (
-                meter_id, meter_name, local_timestamp, api_timestamp,
-                raw_data, current_reading_delta, balance_unit_delta,
-                poll_successful, error_message, is_online
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data["meter_id"],
-            data["meter_name"],
-            data["local_timestamp"],
-            data["api_timestamp"],
-            json.dumps(data["raw_data"]),  # Store raw data as JSON
-            data["current_reading_delta"],
-            data["balance_unit_delta"],
-            data["poll_successful"],
-            data["error_message"],
-            data["is_online"]
-        ))
-
-        self._connection.commit()
         row_id = cursor.lastrowid
         logger.debug(f"Stored snapshot for meter {snapshot.meter_id} (row {row_id})")
         return row_id
 
-    def get_recent_snapshots(self, meter_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def store_snapshots(self, snapshots: Iterable[MeterSnapshot]) -> int:
         """
-        Get recent snapshots for a specific meter.
+        Store several meter snapshots in a single transaction.
 
         Args:
-            meter_id: The meter identifier
-            limit: Maximum number of snapshots to return
+            snapshots: The meter snapshots to store
 
         Returns:
-            List of snapshot dictionaries, most recent first
+            The number of records inserted
+        """
+        cursor = self._cursor
+        cursor.execute("BEGIN")
+        try:
+            # Stream parameter rows so the batch is never materialized as a list
+            cursor.executemany(_INSERT_SNAPSHOT_SQL, map(self._snapshot_row, snapshots))
+            stored = max(cursor.rowcount, 0)
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+        logger.debug(f"Stored {stored} snapshots in one transaction")
+        return stored
+
+    def iter_recent_snapshots(self, meter_id: str, limit: int = 10) -> Iterator[StoredSnapshot]:
         """
-        cursor = self._connection.cursor()
+        Iterate over recent snapshots for a specific meter without materializing them.
 
-        cursor.execute('''
+        Uses its own cursor, so other queries may run while the iterator is open.
+
+        Args:
+            meter_id: The meter identifier
+            limit: Maximum number of snapshots to yield
+
+        Yields:
+            Stored snapshots (raw_data decoded lazily), most recent first
+        """
+        cursor = self._connection.execute('''
             SELECT id, meter_id, meter_name, local_timestamp, api_timestamp,
                    raw_data, current_reading_delta, balance_unit_delta,
                    poll_successful, error_message, is_online
             FROM meter_snapshots
             WHERE meter_id = ?
-            ORDER BY local_timestamp DESC
+            ORDER BY local_timestamp DESC, id DESC  -- served by idx_meter_timestamp scanned backwards
             LIMIT ?
         ''', (meter_id, limit))
 
-        rows = cursor.fetchall()
-        snapshots = []
-
-        for row in rows:
-            snapshot = {
-                "id": row[0],
-                "meter_id": row[1],
-                "meter_name": row[2],
-                "local_timestamp": row[3],
-                "api_timestamp": row[4],
-                "raw_data": json.loads(row[5]) if row[5] else {},
-                "current_reading_delta": row[6],
-                "balance_unit_delta": row[7],
-                "poll_successful": row[8],
-                "error_message": row[9],
-                "is_online": row[10]
-            }
-            snapshots.append(snapshot)
-
-        return snapshots
+        try:
+            for row in cursor:
+                yield StoredSnapshot(row)
+        finally:
+            cursor.close()
+
+    def get_recent_snapshots(self, meter_id: str, limit: int = 10) -> List[StoredSnapshot]:
+        """
+        Get recent snapshots for a specific meter.
+
+        Args:
+            meter_id: The meter identifier
+            limit: Maximum number of snapshots to return
+
+        Returns:
+            List of stored snapshots (raw_data decoded lazily), most recent first
+        """
+        return list(self.iter_recent_snapshots(meter_id, limit))
 
     def get_meter_summary(self, meter_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -166,32 +345,21 @@ class MeterDatabase:
         Returns:
             Summary dictionary or None if no data exists
         """
-        cursor = self._connection.cursor()
+        cursor = self._cursor
 
-        # Get basic stats
         cursor.execute('''
-            SELECT COUNT(*), MIN(local_timestamp), MAX(local_timestamp)
-            FROM meter_snapshots
-            WHERE meter_id = ? AND poll_successful = 1
+            SELECT total_snapshots, first_poll, last_poll,
+                   last_raw_data, last_reading_delta, last_balance_delta
+            FROM meter_latest
+            WHERE meter_id = ?
         ''', (meter_id,))
 
         row = cursor.fetchone()
-        if not row or row[0] == 0:
+        if not row:
             return None
 
-        total_snapshots, first_poll, last_poll = row
-
-        # Get latest values
-        cursor.execute('''
-            SELECT raw_data, current_reading_delta, balance_unit_delta
-            FROM meter_snapshots
-            WHERE meter_id = ? AND poll_successful = 1
-            ORDER BY local_timestamp DESC
-            LIMIT 1
-        ''', (meter_id,))
-
-        latest_row = cursor.fetchone()
-        latest_data = json.loads(latest_row[0]) if latest_row else {}
+        total_snapshots, first_poll, last_poll, raw_data, reading_delta, balance_delta = row
+        latest_data = _decode_raw_data(raw_data)
 
         return {
             "meter_id": meter_id,
@@ -200,8 +368,8 @@ class MeterDatabase:
             "last_poll": last_poll,
             "latest_reading": latest_data.get("current_reading"),
             "latest_balance": latest_data.get("balance_unit"),
-            "latest_reading_delta": latest_row[1] if latest_row else None,
-            "latest_balance_delta": latest_row[2] if latest_row else None
+            "latest_reading_delta": reading_delta,
+            "latest_balance_delta": balance_delta
         }
 
     def store_system_metadata(self, key: str, value: Any) -> None:
@@ -212,14 +380,12 @@ class MeterDatabase:
             key: Metadata key
             value: Metadata value (will be JSON serialized)
         """
-        cursor = self._connection.cursor()
+        cursor = self._cursor
 
         cursor.execute('''
             INSERT OR REPLACE INTO system_metadata (key, value, updated_at)
             VALUES (?, ?, CURRENT_TIMESTAMP)
-        ''', (key, json.dumps(value)))
-
-        self._connection.commit()
+        ''', (key, serialization.dumps(value)))
 
     def get_system_metadata(self, key: str) -> Any:
         """
@@ -231,17 +397,19 @@ class MeterDatabase:
         Returns:
             Deserialized metadata value, or None if not found
         """
-        cursor = self._connection.cursor()
+        cursor = self._cursor
 
         cursor.execute('SELECT value FROM system_metadata WHERE key = ?', (key,))
         row = cursor.fetchone()
 
-        return json.loads(row[0]) if row else None
+        return serialization.loads(row[0]) if row else None
 
     def close(self) -> None:
         """Close the database connection."""
         if self._connection:
+            self._cursor.close()
             self._connection.close()
+            self._cursor = None
             self._connection = None
             logger.info("Database connection closed")
 
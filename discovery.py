@@ -9,24 +9,37 @@ import logging
 from typing import List, Dict, Any, Optional
 from api import APIClient
 from config import Config
+from console import run_interactive
 
 logger = logging.getLogger(__name__)
 
+# Words from the entry prompt that sometimes get pasted back in with the IDs
+_PROMPT_WORDS = frozenset({'enter', 'meter', 'separated', 'commas', 'e.g.'})
+
 
 class MeterDiscovery:
     """Handles discovery and selection of meters to monitor."""
 
-    def __init__(self, config: Config, api_client: APIClient):
+    def __init__(self, config: Config, api_client: APIClient,
+                 prefetched: Optional[List[Dict[str, Any]]] = None):
         self.config = config
         self.api_client = api_client
+        # Meter list already fetched by the caller, used instead of a discovery request
+        self.prefetched = prefetched
 
     async def get_available_meters(self) -> List[Dict[str, Any]]:
         """
         Fetch all available meters for the authenticated user.
 
+        A meter list passed in as prefetched is returned without querying the API.
+
         Returns:
             List of meter dictionaries with their metadata, or empty list if discovery fails
         """
+        if self.prefetched is not None:
+            logger.info(f"Using {len(self.prefetched)} prefetched meters")
+            return list(self.prefetched)
+
         try:
             meters = await self.api_client.get_meters()
             logger.info(f"Discovered {len(meters)} meters")
@@ -50,13 +63,11 @@ class MeterDiscovery:
         print(f"\nFound {len(meters)} meter(s):")
         print("-" * 50)
 
-        for i, meter in enumerate(meters, 1):
-            meter_id = meter.get("id", "Unknown")
-            name = meter.get("name", "Unnamed Meter")
-
-            print(f"{i}. Meter ID: {meter_id}")
-            print(f"   Name: {name}")
-            print()
+        print("\n".join(
+            f"{i}. Meter ID: {meter.get('id', 'Unknown')}\n"
+            f"   Name: {meter.get('name', 'Unnamed Meter')}\n"
+            for i, meter in enumerate(meters, 1)
+        ))
 
     def select_meters_interactive(self, meters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -73,12 +84,17 @@ class MeterDiscovery:
 
         self.display_meter_options(meters)
 
+        meter_count = len(meters)
+        options_text = (
+            "Selection options:\n"
+            f"• Enter a number (1-{meter_count}) to monitor a specific meter\n"
+            "• Enter 'all' to monitor all meters\n"
+            "• Enter 'quit' to exit\n"
+        )
+        invalid_number_text = f"Invalid number. Please enter 1-{meter_count} or 'all'"
+
         while True:
-            print("Selection options:")
-            print("• Enter a number (1-{}) to monitor a specific meter".format(len(meters)))
-            print("• Enter 'all' to monitor all meters")
-            print("• Enter 'quit' to exit")
-            print()
+            print(options_text)
 
             choice = input("Your choice: ").strip().lower()
 
@@ -86,16 +102,16 @@ class MeterDiscovery:
                 logger.info("User chose to quit")
                 return []
             elif choice == 'all':
-                logger.info(f"User selected all {len(meters)} meters for monitoring")
+                logger.info(f"User selected all {meter_count} meters for monitoring")
                 return meters
             elif choice.isdigit():
                 index = int(choice) - 1
-                if 0 <= index < len(meters):
+                if 0 <= index < meter_count:
                     selected_meter = meters[index]
                     logger.info(f"User selected meter: ID={selected_meter.get('id')}, Name={selected_meter.get('name')}")
                     return [selected_meter]
                 else:
-                    print(f"Invalid number. Please enter 1-{len(meters)} or 'all'")
+                    print(invalid_number_text)
             else:
                 print("Invalid choice. Please enter a number, 'all', or 'quit'")
             
@@ -112,24 +128,25 @@ class MeterDiscovery:
         configured_ids = self.config.manual_meter_ids
         if configured_ids:
             print(f"Using configured meter IDs: {', '.join(configured_ids)}")
-            meters = []
-            for meter_id in configured_ids:
-                meters.append({
+            return [
+                {
                     "id": meter_id,
                     "name": f"Configured - {meter_id}",
                     "location": "Configured",
                     "status": "Unknown"
-                })
-            return meters
+                }
+                for meter_id in configured_ids
+            ]
 
         # Try API discovery
         meters = await self.get_available_meters()
 
+        # The prompts block on input(), so run them off the event loop thread
         if meters:
-            return self.select_meters_interactive(meters)
+            return await run_interactive(self.select_meters_interactive, meters)
         else:
             # No meters discovered - allow manual entry
-            return self.manual_meter_entry()
+            return await run_interactive(self.manual_meter_entry)
 
     def manual_meter_entry(self) -> List[Dict[str, Any]]:
         """
@@ -165,7 +182,7 @@ class MeterDiscovery:
             meter_ids = []
             for mid in raw_ids:
                 # Skip if it contains common prompt words
-                if any(word in mid.lower() for word in ['enter', 'meter', 'separated', 'commas', 'e.g.']):
+                if not _PROMPT_WORDS.isdisjoint(mid.lower().split()):
                     continue
                 # Try to convert to int to validate it's numeric
                 try:
@@ -180,14 +197,15 @@ class MeterDiscovery:
                 continue
 
             # Create meter dictionaries for manual entry
-            meters = []
-            for meter_id in meter_ids:
-                meters.append({
+            meters = [
+                {
                     "id": meter_id,
                     "name": f"Manual Entry - {meter_id}",
                     "location": "Unknown",
                     "status": "Unknown"
-                })
+                }
+                for meter_id in meter_ids
+            ]
 
             print(f"\nSelected {len(meters)} meter(s) for monitoring:")
             for meter in meters:
@@ -6,20 +6,100 @@ error handling, and console output.
 """
 
 import asyncio
+import functools
 import logging
+import random
 import signal
 import sys
-from typing import List, Dict, Any
+from contextlib import AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 
 from config import Config
-from api import APIClient
+from console import ainput, run_interactive
+from api import APIClient, SOURCE_API, SOURCE_FALLBACK
 from discovery import MeterDiscovery
 from data_model import MeterSnapshot
 from tracker import MeterTracker
 from database import MeterDatabase
 from transactions import TransactionHistoryManager
 
+# Console output from meter tasks is queued and written in batches
+PRINT_QUEUE_SIZE = 1024
+PRINT_BATCH_SIZE = 256
+PRINT_FLUSH_INTERVAL = 0.05  # seconds
+
+# Snapshots are queued and stored in batches, one transaction per batch
+DB_BATCH_SIZE = 64
+DB_FLUSH_INTERVAL = 1.0  # seconds
+
+# Each poll is shifted by up to this fraction of the polling interval, either way
+POLL_JITTER = 0.05
+
+
+def format_status(meter_name: str, snapshot: MeterSnapshot, poll_time: float) -> str:
+    """
+    Build the one-line console status for a successful poll.
+
+    Args:
+        meter_name: Display name of the meter
+        snapshot: Snapshot produced by the poll
+        poll_time: Poll duration in seconds
+
+    Returns:
+        Status fields joined with " | "
+    """
+    currency = snapshot.currency
+    unit_price = snapshot.unit_price
+    current_reading = snapshot.current_reading
+    balance_unit = snapshot.balance_unit
+    reading_delta = snapshot.current_reading_delta
+    balance_delta = snapshot.balance_unit_delta
+    warning_at_unit = snapshot.warning_at_unit
+
+    parts = [f"{meter_name}", f"Status: {snapshot.get_connectivity_status()}", f"Poll time: {poll_time:.2f}s"]
+
+    # Meter identifier
+    if snapshot.vendor_meter_id:
+        parts.append(f"HW ID: {snapshot.vendor_meter_id}")
+
+    # Energy reading and consumption cost
+    if current_reading is not None:
+        parts.append(f"Reading: {current_reading:.2f}")
+        if unit_price is not None and currency:
+            parts.append(f"Cost: {current_reading * unit_price:.2f}{currency}")
+
+    # Balance and cost of balance
+    if balance_unit is not None:
+        parts.append(f"Balance: {balance_unit:.2f}")
+        if unit_price is not None and currency:
+            parts.append(f"Balance $: {balance_unit * unit_price:.2f}{currency}")
+
+        # Balance warning if low
+        if warning_at_unit and balance_unit <= warning_at_unit:
+            parts.append(f"⚠ LOW BALANCE (warn at {warning_at_unit})")
+
+    # Pricing information
+    if unit_price and currency:
+        parts.append(f"Price: {unit_price}{currency}/unit")
+
+    # Delta information
+    if reading_delta or balance_delta:
+        if reading_delta and balance_delta:
+            changes = f"ΔReading: {reading_delta:+.2f} | ΔBalance: {balance_delta:+.2f}"
+        elif reading_delta:
+            changes = f"ΔReading: {reading_delta:+.2f}"
+        else:
+            changes = f"ΔBalance: {balance_delta:+.2f}"
+        parts.append(f"Changes: {changes}")
+
+    # Last connection info
+    if snapshot.last_connected_at:
+        parts.append(f"Last conn: {snapshot.last_connected_at}")
+
+    return " | ".join(parts)
+
 
 class MeterMonitor:
     """Main monitoring system coordinator."""
@@ -29,8 +109,22 @@ class MeterMonitor:
         self.setup_logging()
         self.tracker = MeterTracker()
         self.database: MeterDatabase = None
+        self.api_client: APIClient = None
+        # Owns the async resources opened in initialize(); closed when run() finishes
+        self._exit_stack = AsyncExitStack()
+        self.tx_manager = TransactionHistoryManager(self.config)
+        self._initial_meters: Optional[List[Dict[str, Any]]] = None
         self.running = False
         self.monitoring_tasks: List[asyncio.Task] = []
+        self._print_queue: Optional[asyncio.Queue] = None
+        self._printer_task: Optional[asyncio.Task] = None
+        self._gather_future: Optional[asyncio.Future] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._db_queue: Optional[asyncio.Queue] = None
+        self._db_writer_task: Optional[asyncio.Task] = None
+        self._poll_semaphore: Optional[asyncio.Semaphore] = None
+        # All database calls during monitoring run on this one thread, in submission order
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="meter-db")
 
     def setup_logging(self) -> None:
         """Configure logging based on configuration."""
@@ -48,17 +142,26 @@ class MeterMonitor:
         """Initialize the monitoring system."""
         logger = logging.getLogger(__name__)
 
+        # Polls that land inside the status TTL are served from cache and not recorded
+        if self.config.status_ttl_seconds >= self.config.polling_interval:
+            logger.warning(
+                f"cache.status_ttl_seconds ({self.config.status_ttl_seconds}s) is not below "
+                f"polling.interval_seconds ({self.config.polling_interval}s) - meters will be "
+                f"polled at most once every {self.config.status_ttl_seconds}s"
+            )
+
         try:
-            # Test API connection and authentication
-            async with APIClient(self.config) as api_client:
-                # Test with meter discovery to validate token
-                try:
-                    await api_client.get_meters()
-                except Exception as auth_test_error:
-                    # If it's an auth error, re-raise
-                    if "401" in str(auth_test_error) or "403" in str(auth_test_error):
-                        raise ValueError("Authentication failed - invalid merchant token") from auth_test_error
-                    # For other errors (like 404 for discovery), auth is probably OK
+            # One client (and connection pool) is shared by every request for the whole run
+            self.api_client = await self._exit_stack.enter_async_context(APIClient(self.config))
+
+            # Test with meter discovery to validate token; the result seeds meter selection
+            try:
+                self._initial_meters = await self.api_client.get_meters()
+            except Exception as auth_test_error:
+                # If it's an auth error, re-raise
+                if "401" in str(auth_test_error) or "403" in str(auth_test_error):
+                    raise ValueError("Authentication failed - invalid merchant token") from auth_test_error
+                # For other errors (like 404 for discovery), auth is probably OK
 
             # Initialize database
             self.database = MeterDatabase(self.config)
@@ -71,120 +174,200 @@ class MeterMonitor:
         """Handle meter discovery and selection."""
         logger = logging.getLogger(__name__)
 
-        async with APIClient(self.config) as api_client:
-            discovery = MeterDiscovery(self.config, api_client)
-            selected_meters = await discovery.discover_and_select_meters()
+        discovery = MeterDiscovery(self.config, self.api_client, prefetched=self._initial_meters)
+        selected_meters = await discovery.discover_and_select_meters()
 
-            if not selected_meters:
-                return []
+        if not selected_meters:
+            return []
 
-            return selected_meters
+        return selected_meters
 
-    async def monitor_meter(self, meter: Dict[str, Any]) -> None:
+    async def monitor_meter(self, meter: Dict[str, Any], api_client: APIClient) -> None:
         """
         Monitor a single meter by polling its status periodically.
 
         Args:
             meter: Meter information dictionary
+            api_client: Shared API client used for all polls
         """
         logger = logging.getLogger(__name__)
         meter_id = meter.get("id")
         meter_name = meter.get("name", f"Meter {meter_id}")
-
-        async with APIClient(self.config) as api_client:
-            while self.running:
-                try:
-                    # Poll meter status
-                    start_time = datetime.now()
-                    meter_data = await api_client.get_meter_status(meter_id)
-
-                    # Create snapshot
-                    snapshot = MeterSnapshot.from_api_response(
-                        meter_id,
-                        meter_data,
-                        self.tracker.get_previous_snapshot(meter_id)
-                    )
+        loop = asyncio.get_running_loop()
+
+        # Polls are scheduled against absolute deadlines so processing time does not
+        # drift the cadence, and each meter gets a random phase within the interval
+        interval = self.config.polling_interval
+        next_poll = loop.time() + random.random() * interval
+
+        # Bind per-poll callables once; the loop body runs for every meter on every cycle
+        now_fn = loop.time
+        semaphore = self._poll_semaphore
+        poll_status = api_client.poll_meter_status
+        from_api = MeterSnapshot.from_api_response
+        update_state = self.tracker.update_meter_state
+        enqueue_snapshot = self._db_queue.put_nowait
+        emit = self._emit
+        stop_event = self._stop_event
+
+        while not stop_event.is_set():
+            try:
+                # Poll meter status
+                start_time = now_fn()
+                async with semaphore:
+                    meter_data, source = await poll_status(meter_id)
+
+                if source == SOURCE_API:
+                    # Create snapshot (deltas are filled in by the tracker below)
+                    snapshot = from_api(meter_id, meter_data)
 
                     # Update tracker (computes deltas)
-                    self.tracker.update_meter_state(snapshot)
+                    update_state(snapshot)
 
-                    # Store in database
-                    self.database.store_snapshot(snapshot)
+                    # Store in database (batched by the writer task)
+                    enqueue_snapshot(snapshot)
 
                     # Log status
-                    poll_time = (datetime.now() - start_time).total_seconds()
-                    
-                    # Build comprehensive status message
-                    status = snapshot.get_connectivity_status()
-
-                    # Build detailed status message
-                    status_parts = [
-                        f"{meter_name}",
-                        f"Status: {status}",
-                        f"Poll time: {poll_time:.2f}s",
-                    ]
-
-                    # Add meter identifier
-                    if snapshot.vendor_meter_id:
-                        status_parts.append(f"HW ID: {snapshot.vendor_meter_id}")
-
-                    # Add energy reading and consumption cost
-                    current_reading = snapshot.get_current_reading()
-                    if current_reading is not None:
-                        status_parts.append(f"Reading: {current_reading:.2f}")
-                        cost_estimate = snapshot.get_cost_estimate()
-                        if cost_estimate is not None and snapshot.currency:
-                            status_parts.append(f"Cost: {cost_estimate:.2f}{snapshot.currency}")
-
-                    # Add balance and cost of balance
-                    balance_unit = snapshot.get_balance_unit()
-                    if balance_unit is not None:
-                        status_parts.append(f"Balance: {balance_unit:.2f}")
-                        balance_cost = snapshot.get_balance_cost()
-                        if balance_cost is not None and snapshot.currency:
-                            status_parts.append(f"Balance $: {balance_cost:.2f}{snapshot.currency}")
-
-                    # Add balance warning info if low
-                    if snapshot.warning_at_unit and balance_unit is not None:
-                        if balance_unit <= snapshot.warning_at_unit:
-                            status_parts.append(f"⚠ LOW BALANCE (warn at {snapshot.warning_at_unit})")
-
-                    # Add pricing information
-                    if snapshot.unit_price and snapshot.currency:
-                        status_parts.append(f"Price: {snapshot.unit_price}{snapshot.currency}/unit")
-
-                    # Add delta information
-                    delta_parts = []
-                    if snapshot.current_reading_delta is not None and snapshot.current_reading_delta != 0:
-                        delta_parts.append(f"ΔReading: {snapshot.current_reading_delta:+.2f}")
-                    if snapshot.balance_unit_delta is not None and snapshot.balance_unit_delta != 0:
-                        delta_parts.append(f"ΔBalance: {snapshot.balance_unit_delta:+.2f}")
-
-                    if delta_parts:
-                        status_parts.append(f"Changes: {' | '.join(delta_parts)}")
-
-                    # Add last connection info
-                    if snapshot.last_connected_at:
-                        status_parts.append(f"Last conn: {snapshot.last_connected_at}")
+                    poll_time = now_fn() - start_time
 
                     # Print the comprehensive status
-                    print(" | ".join(status_parts))
+                    emit(format_status(meter_name, snapshot, poll_time))
+                elif source == SOURCE_FALLBACK:
+                    # The request failed; the last known status is not a new reading
+                    error = "Status request failed - last known status served from fallback"
+                    enqueue_snapshot(MeterSnapshot.create_error_snapshot(meter_id, error))
+                    emit(f"{meter_name}: ERROR - {error}")
+                # Cache hits were already stored and printed when first fetched
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Create error snapshot
+                error_snapshot = MeterSnapshot.create_error_snapshot(meter_id, str(e))
+                enqueue_snapshot(error_snapshot)
+                emit(f"{meter_name}: ERROR - {e}")
+
+            # Wait for next poll
+            next_poll += interval
+            now = now_fn()
+            if next_poll < now:
+                # Fell behind (slow poll); resume from now instead of bursting to catch up
+                next_poll = now
+            jitter = interval * random.uniform(-POLL_JITTER, POLL_JITTER)
+            try:
+                # Sleeps until the next deadline, or returns early once shutdown is requested
+                await asyncio.wait_for(stop_event.wait(), max(0.0, next_poll + jitter - now))
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                break
 
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    # Create error snapshot
-                    error_snapshot = MeterSnapshot.create_error_snapshot(meter_id, str(e))
-                    self.database.store_snapshot(error_snapshot)
-                    print(f"{meter_name}: ERROR - {e}")
+        logger.info(f"Stopped monitoring for {meter_name}")
+
+    def _shutdown(self) -> None:
+        """
+        Ask every monitoring task to stop.
+
+        Waiting tasks exit immediately and polls in progress are allowed to
+        finish. A second request cancels the tasks outright.
+        """
+        self.running = False
+        if self._stop_event is not None and not self._stop_event.is_set():
+            self._stop_event.set()
+        elif self._gather_future is not None:
+            self._gather_future.cancel()
+
+    def _emit(self, line: str) -> None:
+        """
+        Queue a line of console output for the printer task.
+
+        Lines are dropped if the printer has fallen too far behind.
+
+        Args:
+            line: Text to print, without trailing newline
+        """
+        try:
+            self._print_queue.put_nowait(line)
+        except asyncio.QueueFull:
+            pass
+
+    @staticmethod
+    def _write_lines(lines: List[str]) -> None:
+        """Write a batch of lines to stdout with a single write call."""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    async def _printer(self) -> None:
+        """Write queued console output to stdout in batches until cancelled."""
+        queue = self._print_queue
+        lines: List[str] = []
+        try:
+            while True:
+                lines.append(await queue.get())
+                # Give other meters a moment to add their lines to this batch
+                await asyncio.sleep(PRINT_FLUSH_INTERVAL)
+                while len(lines) < PRINT_BATCH_SIZE and not queue.empty():
+                    lines.append(queue.get_nowait())
+                self._write_lines(lines)
+                lines = []
+        finally:
+            # Flush whatever is still pending on shutdown
+            while not queue.empty():
+                lines.append(queue.get_nowait())
+            if lines:
+                self._write_lines(lines)
 
-                # Wait for next poll
+    async def _run_db(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking database call on the dedicated database thread.
+
+        Args:
+            func: Database method to call
+            *args: Positional arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._db_executor, functools.partial(func, *args))
+
+    async def _db_writer(self) -> None:
+        """
+        Store queued snapshots in batches until a None sentinel is dequeued.
+
+        A batch is written once it holds DB_BATCH_SIZE snapshots or its first
+        snapshot has waited DB_FLUSH_INTERVAL seconds. Writes run on the
+        database thread so the event loop keeps polling meanwhile.
+        """
+        logger = logging.getLogger(__name__)
+        queue = self._db_queue
+        loop = asyncio.get_running_loop()
+
+        stopping = False
+        while not stopping:
+            snapshot = await queue.get()
+            if snapshot is None:
+                break
+
+            batch = [snapshot]
+            deadline = loop.time() + DB_FLUSH_INTERVAL
+            while len(batch) < DB_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
                 try:
-                    await asyncio.sleep(self.config.polling_interval)
-                except asyncio.CancelledError:
+                    snapshot = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if snapshot is None:
+                    stopping = True
                     break
+                batch.append(snapshot)
 
-        logger.info(f"Stopped monitoring for {meter_name}")
+            try:
+                await self._run_db(self.database.store_snapshots, batch)
+            except Exception as e:
+                logger.error(f"Failed to store {len(batch)} snapshots: {e}")
 
     async def start_monitoring(self, selected_meters: List[Dict[str, Any]]) -> None:
         """
@@ -200,36 +383,63 @@ class MeterMonitor:
             return
 
         self.running = True
+        self._stop_event = asyncio.Event()
 
         # Store monitoring start metadata
-        self.database.store_system_metadata("monitoring_start", {
+        await self._run_db(self.database.store_system_metadata, "monitoring_start", {
             "timestamp": datetime.now().isoformat(),
             "meters": [m.get("id") for m in selected_meters]
         })
 
+        # Start the database writer and console writer before any meter can produce output
+        self._db_queue = asyncio.Queue()
+        self._db_writer_task = asyncio.create_task(self._db_writer())
+
+        self._print_queue = asyncio.Queue(maxsize=PRINT_QUEUE_SIZE)
+        self._printer_task = asyncio.create_task(self._printer())
+
+        # Cap in-flight status polls across all meters
+        self._poll_semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
         # Create monitoring tasks
         self.monitoring_tasks = []
         for meter in selected_meters:
-            task = asyncio.create_task(self.monitor_meter(meter))
+            task = asyncio.create_task(self.monitor_meter(meter, self.api_client))
             self.monitoring_tasks.append(task)
 
         # Set up signal handlers for graceful shutdown
-        def signal_handler(signum, frame):
-            self.running = False
-            for task in self.monitoring_tasks:
-                task.cancel()
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        self._gather_future = asyncio.gather(*self.monitoring_tasks, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        shutdown_signals = (signal.SIGINT, signal.SIGTERM)
+        for sig in shutdown_signals:
+            try:
+                loop.add_signal_handler(sig, self._shutdown)
+            except NotImplementedError:
+                # Event loops on Windows have no signal handler support
+                signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(self._shutdown))
 
         try:
             # Wait for all monitoring tasks
-            await asyncio.gather(*self.monitoring_tasks, return_exceptions=True)
+            await self._gather_future
         except asyncio.CancelledError:
             pass
         finally:
+            for sig in shutdown_signals:
+                try:
+                    loop.remove_signal_handler(sig)
+                except NotImplementedError:
+                    signal.signal(sig, signal.SIG_DFL if sig != signal.SIGINT else signal.default_int_handler)
+
+            # Stop the console writer; it flushes pending lines when cancelled
+            self._printer_task.cancel()
+            await asyncio.gather(self._printer_task, return_exceptions=True)
+
+            # Let the database writer store everything still queued, then stop
+            self._db_queue.put_nowait(None)
+            await self._db_writer_task
+
             # Store monitoring end metadata
-            self.database.store_system_metadata("monitoring_end", {
+            await self._run_db(self.database.store_system_metadata, "monitoring_end", {
                 "timestamp": datetime.now().isoformat(),
                 "reason": "shutdown"
             })
@@ -252,7 +462,7 @@ class MeterMonitor:
                 print("2. View transaction history for a meter")
                 print("3. Exit")
 
-                choice = input("\nEnter your choice (1-3): ").strip()
+                choice = (await ainput("\nEnter your choice (1-3): ")).strip()
 
                 if choice == "1":
                     await self._run_monitoring()
@@ -271,6 +481,8 @@ class MeterMonitor:
             print(f"Fatal error: {e}")
             raise
         finally:
+            await self._exit_stack.aclose()
+            self._db_executor.shutdown(wait=True)
             if self.database:
                 self.database.close()
 
@@ -293,55 +505,54 @@ class MeterMonitor:
         logger = logging.getLogger(__name__)
 
         try:
-            async with APIClient(self.config) as api_client:
-                # Get available meters
-                meters = await api_client.get_meters()
-                if not meters:
-                    print("No meters found")
-                    return
+            # Get available meters
+            meters = await self.api_client.get_meters()
+            if not meters:
+                print("No meters found")
+                return
+
+            # Display meter options
+            print("\nAvailable meters:")
+            for i, meter in enumerate(meters, 1):
+                meter_id = meter.get("id")
+                name = meter.get("name", "Unknown")
+                balance = meter.get("balance_unit", 0)
+                reading = meter.get("current_reading", 0)
+                print(f"{i}. {name} (ID: {meter_id})")
+                print(f"   Reading: {reading:.2f} | Balance: {balance:.2f}")
+
+            # Let user select a meter
+            while True:
+                choice = (await ainput("\nEnter meter number (or 'cancel' to return): ")).strip()
 
-                # Display meter options
-                print("\nAvailable meters:")
-                for i, meter in enumerate(meters, 1):
-                    meter_id = meter.get("id")
-                    name = meter.get("name", "Unknown")
-                    balance = meter.get("balance_unit", 0)
-                    reading = meter.get("current_reading", 0)
-                    print(f"{i}. {name} (ID: {meter_id})")
-                    print(f"   Reading: {reading:.2f} | Balance: {balance:.2f}")
-
-                # Let user select a meter
-                while True:
-                    choice = input("\nEnter meter number (or 'cancel' to return): ").strip()
-
-                    if choice.lower() == "cancel":
-                        return
-
-                    try:
-                        meter_idx = int(choice) - 1
-                        if 0 <= meter_idx < len(meters):
-                            selected_meter = meters[meter_idx]
-                            break
-                        else:
-                            print("Invalid meter number")
-                    except ValueError:
-                        print("Please enter a valid number or 'cancel'")
-
-                meter_id = selected_meter.get("id")
-                meter_name = selected_meter.get("name", f"Meter {meter_id}")
-
-                # Get date range from user
-                tx_manager = TransactionHistoryManager(self.config)
-                date_from, date_to = tx_manager.display_date_range_options()
-
-                if date_from is None or date_to is None:
-                    print("Cancelled")
+                if choice.lower() == "cancel":
                     return
 
-                # Fetch and display transaction history
-                print(f"\nFetching transaction history for {meter_name}...")
-                result = await tx_manager.fetch_all_transactions(api_client, meter_id, date_from, date_to)
-                tx_manager.display_transaction_history(result)
+                try:
+                    meter_idx = int(choice) - 1
+                    if 0 <= meter_idx < len(meters):
+                        selected_meter = meters[meter_idx]
+                        break
+                    else:
+                        print("Invalid meter number")
+                except ValueError:
+                    print("Please enter a valid number or 'cancel'")
+
+            meter_id = selected_meter.get("id")
+            meter_name = selected_meter.get("name", f"Meter {meter_id}")
+
+            # Get date range from user
+            tx_manager = self.tx_manager
+            date_from, date_to = await run_interactive(tx_manager.display_date_range_options)
+
+            if date_from is None or date_to is None:
+                print("Cancelled")
+                return
+
+            # Fetch and display transaction history
+            print(f"\nFetching transaction history for {meter_name}...")
+            result = await tx_manager.fetch_all_transactions(self.api_client, meter_id, date_from, date_to)
+            tx_manager.display_transaction_history(result)
 
         except Exception as e:
             logger.error(f"Error viewing transaction history: {e}")
@@ -350,10 +561,27 @@ class MeterMonitor:
 
 async def main():
     """Entry point for the application."""
+    # Start tasks eagerly so polls that resolve from cache never hit the ready queue (3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     monitor = MeterMonitor()
     await monitor.run()
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
     # Run the async main function
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
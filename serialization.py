@@ -0,0 +1,59 @@
+"""
+Serialization module for the electricity meter monitoring system.
+
+This module provides JSON encoding and decoding helpers that use orjson when
+it is installed and fall back to the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON bytes.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a value as a compact JSON string.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
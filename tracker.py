@@ -7,7 +7,7 @@ delta computation and state management.
 
 import logging
 from typing import Dict, Optional, Any
-from data_model import MeterSnapshot
+from data_model import MeterSnapshot, compute_deltas
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +41,19 @@ class MeterTracker:
 
         # Compute deltas if we have a previous snapshot
         if previous_snapshot and snapshot.poll_successful:
-            snapshot._compute_deltas(previous_snapshot)
+            reading_delta, balance_delta = compute_deltas(
+                previous_snapshot.current_reading, previous_snapshot.balance_unit,
+                snapshot.current_reading, snapshot.balance_unit
+            )
+            snapshot.current_reading_delta = reading_delta
+            snapshot.balance_unit_delta = balance_delta
 
             # Log significant changes
-            if snapshot.current_reading_delta is not None and snapshot.current_reading_delta != 0:
-                logger.info(f"Meter {meter_id}: current_reading changed by {snapshot.current_reading_delta}")
+            if reading_delta:
+                logger.info(f"Meter {meter_id}: current_reading changed by {reading_delta}")
 
-            if snapshot.balance_unit_delta is not None and snapshot.balance_unit_delta != 0:
-                logger.info(f"Meter {meter_id}: balance_unit changed by {snapshot.balance_unit_delta}")
+            if balance_delta:
+                logger.info(f"Meter {meter_id}: balance_unit changed by {balance_delta}")
 
         # Update the stored previous snapshot only if this poll was successful
         if snapshot.poll_successful:
@@ -107,6 +112,6 @@ class MeterTracker:
             "meter_name": previous.meter_name,
             "last_reading": previous.get_current_reading(),
             "last_balance": previous.get_balance_unit(),
-            "last_poll_time": previous.local_timestamp.isoformat(),
-            "is_online": previous.is_online()
+            "last_poll_time": previous.get_local_timestamp_iso(),
+            "is_online": previous.is_online
         }
\ No newline at end of file
@@ -5,20 +5,78 @@ This module handles fetching transaction history for meters and provides
 analysis and display functionality.
 """
 
+import asyncio
+import heapq
 import logging
+import sys
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from api import APIClient
 from config import Config
+from data_model import TransactionRecord
 
 logger = logging.getLogger(__name__)
 
+# Number of most recent transactions listed in the history view
+DISPLAY_LIMIT = 20
+
+# Status glyph per transaction, indexed by whether it completed (status == 2)
+_STATUS = ("○", "✓")
+
+# Layout of one row in the transaction details listing
+_ROW_FMT = "{i:2}. [{status}] {date:<25} {tx_type:<15} {amount:>8.2f} RM  {units:>8.2f} units"
+
+# Preset date-range menu choices and how many days back each one reaches
+_PRESET_DAYS = {"1": 30, "2": 60, "3": 90, "4": 180, "5": 365, "6": 365*5}
+
+# Number of closed date-range queries kept in memory (least recently used evicted first)
+TRANSACTION_CACHE_SIZE = 32
+
 
 class TransactionHistoryManager:
     """Manages retrieval and analysis of meter transactions."""
 
     def __init__(self, config: Config):
         self.config = config
+        # Transactions for date ranges that ended before today cannot change,
+        # so they are cached by (meter_id, date_from, date_to)
+        self._transaction_cache: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        # Analyses of transaction dicts already shown, keyed by (id, len); each entry
+        # holds the dict itself so its id cannot be reused while cached
+        self._analysis_cache: Dict[Tuple[int, int], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+    async def _get_transactions(self, api_client: APIClient, meter_id: str,
+                                date_from: str, date_to: str) -> Dict[str, Any]:
+        """
+        Get transactions for a date range, from the cache when the range is closed.
+
+        Args:
+            api_client: APIClient instance
+            meter_id: Meter ID to fetch transactions for
+            date_from: Start date (YYYY-MM-DD)
+            date_to: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary of transactions (keyed by transaction ID)
+        """
+        key = (meter_id, date_from, date_to)
+        cached = self._transaction_cache.get(key)
+        if cached is not None:
+            self._transaction_cache.move_to_end(key)
+            logger.debug("Using cached transactions for meter %s from %s to %s", meter_id, date_from, date_to)
+            return cached
+
+        transactions = await api_client.get_meter_transactions(meter_id, date_from, date_to)
+        # New data landed; drop analyses of earlier results
+        self._analysis_cache.clear()
+
+        if date_to < datetime.now().strftime("%Y-%m-%d"):
+            self._transaction_cache[key] = transactions
+            if len(self._transaction_cache) > TRANSACTION_CACHE_SIZE:
+                self._transaction_cache.popitem(last=False)
+
+        return transactions
 
     async def fetch_all_transactions(self, api_client: APIClient, meter_id: str,
                                      date_from: Optional[str] = None,
@@ -35,28 +93,84 @@ class TransactionHistoryManager:
         Returns:
             Dictionary of transactions with analysis
         """
-        # Set default date range (last year if not specified)
-        if not date_to:
-            date_to = datetime.now().strftime("%Y-%m-%d")
-        if not date_from:
-            date_from = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+        date_from, date_to = self._resolve_date_range(date_from, date_to)
 
-        logger.info(f"Fetching transactions for meter {meter_id} from {date_from} to {date_to}")
+        logger.info("Fetching transactions for meter %s from %s to %s", meter_id, date_from, date_to)
 
-        transactions = await api_client.get_meter_transactions(meter_id, date_from, date_to)
+        transactions = await self._get_transactions(api_client, meter_id, date_from, date_to)
+
+        return self._build_result(meter_id, date_from, date_to, transactions)
 
-        # Analyze the transactions
-        analysis = self._analyze_transactions(transactions)
+    async def fetch_many_transactions(self, api_client: APIClient, meter_ids: List[str],
+                                      date_from: Optional[str] = None,
+                                      date_to: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch transactions for several meters concurrently over the same date range.
 
+        Args:
+            api_client: APIClient instance
+            meter_ids: Meter IDs to fetch transactions for
+            date_from: Start date (YYYY-MM-DD), default: 1 year ago
+            date_to: End date (YYYY-MM-DD), default: today
+
+        Returns:
+            One result per meter, in the order of meter_ids, shaped like fetch_all_transactions
+        """
+        date_from, date_to = self._resolve_date_range(date_from, date_to)
+
+        logger.info("Fetching transactions for %d meters from %s to %s", len(meter_ids), date_from, date_to)
+
+        all_transactions = await asyncio.gather(*(
+            self._get_transactions(api_client, meter_id, date_from, date_to) for meter_id in meter_ids
+        ))
+
+        return [
+            self._build_result(meter_id, date_from, date_to, transactions)
+            for meter_id, transactions in zip(meter_ids, all_transactions)
+        ]
+
+    @staticmethod
+    def _resolve_date_range(date_from: Optional[str], date_to: Optional[str]) -> Tuple[str, str]:
+        """Fill in the default date range (the last year) for missing bounds."""
+        if not date_to or not date_from:
+            now = datetime.now()
+            if not date_to:
+                date_to = now.strftime("%Y-%m-%d")
+            if not date_from:
+                date_from = (now - timedelta(days=365)).strftime("%Y-%m-%d")
+        return date_from, date_to
+
+    def _build_result(self, meter_id: str, date_from: str, date_to: str,
+                      transactions: Dict[str, Any]) -> Dict[str, Any]:
+        """Bundle fetched transactions with their analysis."""
         return {
             "meter_id": meter_id,
             "date_from": date_from,
             "date_to": date_to,
             "transactions": transactions,
-            "analysis": analysis
+            "analysis": self._analyze_transactions(transactions)
         }
 
     def _analyze_transactions(self, transactions: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze transactions, reusing the previous analysis of the same dict.
+
+        Args:
+            transactions: Dictionary of transaction data
+
+        Returns:
+            Analysis dictionary with statistics
+        """
+        cache_key = (id(transactions), len(transactions))
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None and cached[0] is transactions:
+            return cached[1]
+
+        analysis = self._compute_analysis(transactions)
+        self._analysis_cache[cache_key] = (transactions, analysis)
+        return analysis
+
+    def _compute_analysis(self, transactions: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze transactions to extract summary statistics.
 
@@ -66,7 +180,15 @@ class TransactionHistoryManager:
         Returns:
             Analysis dictionary with statistics
         """
-        if not transactions:
+        # Convert well-formed entries to compact records once; everything below works on them
+        records = [
+            TransactionRecord.from_api_response(key, tx)
+            for key, tx in transactions.items()
+            if isinstance(tx, dict)
+        ]
+
+        # Nothing usable (empty or only malformed entries): skip the aggregation entirely
+        if not records:
             return {
                 "total_transactions": 0,
                 "total_amount": 0,
@@ -74,57 +196,47 @@ class TransactionHistoryManager:
                 "by_type": {}
             }
 
-        # Initialize counters
-        by_type = {}
-        total_amount = 0
-        total_units = 0
-        transactions_list = []
-
-        for key, tx in transactions.items():
-            if not isinstance(tx, dict):
-                continue
-
-            tx_type = tx.get("type", "UNKNOWN")
-            if tx_type not in by_type:
-                by_type[tx_type] = {
-                    "count": 0,
-                    "total_amount": 0,
-                    "total_units": 0,
-                    "avg_amount": 0,
-                    "avg_units": 0,
-                }
-
-            amount = float(tx.get("total_price", 0))
-            units = float(tx.get("unit", 0))
-
-            by_type[tx_type]["count"] += 1
-            by_type[tx_type]["total_amount"] += amount
-            by_type[tx_type]["total_units"] += units
-
-            total_amount += amount
-            total_units += units
-            transactions_list.append(tx)
-
-        # Calculate averages
-        for tx_type in by_type:
-            count = by_type[tx_type]["count"]
-            if count > 0:
-                by_type[tx_type]["avg_amount"] = by_type[tx_type]["total_amount"] / count
-                by_type[tx_type]["avg_units"] = by_type[tx_type]["total_units"] / count
-
-        # Sort by date
-        transactions_list.sort(
-            key=lambda x: x.get("created_at", ""),
-            reverse=True
-        )
+        total_amount = sum([record.amount for record in records])
+        total_units = sum([record.units for record in records])
+
+        # Per-type totals are kept as [count, amount, units] lists and turned
+        # into dicts once at the end (averages are derived when displayed)
+        totals_by_type: Dict[str, List[float]] = {}
+        for record in records:
+            totals = totals_by_type.get(record.tx_type)
+            if totals is None:
+                totals_by_type[record.tx_type] = [1, record.amount, record.units]
+            else:
+                totals[0] += 1
+                totals[1] += record.amount
+                totals[2] += record.units
+
+        by_type = {
+            tx_type: {
+                "count": count,
+                "total_amount": type_amount,
+                "total_units": type_units,
+            }
+            for tx_type, (count, type_amount, type_units) in totals_by_type.items()
+        }
+
+        # Only the date endpoints and the newest few records are needed, so select
+        # them over pre-extracted keys instead of sorting everything. Ties resolve
+        # as in a stable newest-first sort: the oldest is the last of equal dates.
+        created_ats = [record.created_at or "" for record in records]
+        by_date = created_ats.__getitem__
+        newest_first = heapq.nlargest(DISPLAY_LIMIT, range(len(records)), key=by_date)
+        oldest_index = min(reversed(range(len(records))), key=by_date)
 
         return {
-            "total_transactions": len(transactions_list),
+            "total_transactions": len(records),
             "total_amount": total_amount,
             "total_units": total_units,
             "by_type": by_type,
-            "oldest_transaction": transactions_list[-1].get("created_at") if transactions_list else None,
-            "newest_transaction": transactions_list[0].get("created_at") if transactions_list else None,
+            "oldest_transaction": records[oldest_index].created_at,
+            "newest_transaction": records[newest_first[0]].created_at,
+            # The most recent transactions, newest first
+            "recent_transactions": [records[i] for i in newest_first],
         }
 
     def display_transaction_history(self, result: Dict[str, Any]) -> None:
@@ -140,64 +252,70 @@ class TransactionHistoryManager:
         transactions = result["transactions"]
         analysis = result["analysis"]
 
-        print("\n" + "="*100)
-        print(f"TRANSACTION HISTORY - Meter ID: {meter_id}")
-        print(f"Date Range: {date_from} to {date_to}")
-        print("="*100)
+        # The report is assembled line by line and written with a single call
+        lines = []
+        add = lines.append
+
+        add("\n" + "="*100)
+        add(f"TRANSACTION HISTORY - Meter ID: {meter_id}")
+        add(f"Date Range: {date_from} to {date_to}")
+        add("="*100)
 
         # Display summary
-        print(f"\nSUMMARY:")
-        print(f"  Total Transactions: {analysis['total_transactions']}")
-        print(f"  Total Amount:       {analysis['total_amount']:.2f} RM")
-        print(f"  Total Units:        {analysis['total_units']:.2f}")
+        add(f"\nSUMMARY:")
+        add(f"  Total Transactions: {analysis['total_transactions']}")
+        add(f"  Total Amount:       {analysis['total_amount']:.2f} RM")
+        add(f"  Total Units:        {analysis['total_units']:.2f}")
 
         if analysis["total_transactions"] > 0:
-            print(f"  Average per Transaction: {analysis['total_amount']/analysis['total_transactions']:.2f} RM")
-            print(f"  Date Range: {analysis.get('oldest_transaction', 'N/A')} to {analysis.get('newest_transaction', 'N/A')}")
+            add(f"  Average per Transaction: {analysis['total_amount']/analysis['total_transactions']:.2f} RM")
+            add(f"  Date Range: {analysis.get('oldest_transaction', 'N/A')} to {analysis.get('newest_transaction', 'N/A')}")
 
         # Display breakdown by type
         if analysis["by_type"]:
-            print(f"\nBREAKDOWN BY TYPE:")
+            add(f"\nBREAKDOWN BY TYPE:")
             for tx_type, stats in analysis["by_type"].items():
-                print(f"\n  {tx_type}:")
-                print(f"    Count:        {stats['count']}")
-                print(f"    Total Amount: {stats['total_amount']:.2f} RM")
-                print(f"    Total Units:  {stats['total_units']:.2f}")
-                print(f"    Avg Amount:   {stats['avg_amount']:.2f} RM")
-                print(f"    Avg Units:    {stats['avg_units']:.2f}")
+                add(f"\n  {tx_type}:")
+                add(f"    Count:        {stats['count']}")
+                add(f"    Total Amount: {stats['total_amount']:.2f} RM")
+                add(f"    Total Units:  {stats['total_units']:.2f}")
+                add(f"    Avg Amount:   {stats['total_amount'] / stats['count']:.2f} RM")
+                add(f"    Avg Units:    {stats['total_units'] / stats['count']:.2f}")
 
         # Display transactions
         if transactions:
-            print(f"\nTRANSACTION DETAILS (most recent first):")
-            print("─"*100)
+            add(f"\nTRANSACTION DETAILS (most recent first):")
+            add("─"*100)
 
-            # Sort transactions by date (most recent first)
-            sorted_txs = sorted(
-                [(k, v) for k, v in transactions.items() if isinstance(v, dict)],
-                key=lambda x: x[1].get("created_at", ""),
-                reverse=True
-            )
+            # The analysis already ordered the transactions (most recent first)
+            recent = analysis.get("recent_transactions", [])
 
-            for i, (key, tx) in enumerate(sorted_txs[:20], 1):  # Show first 20
-                date = tx.get("created_at", "N/A")
-                tx_type = tx.get("type", "UNKNOWN")
-                amount = tx.get("total_price", 0)
-                units = tx.get("unit", 0)
-                status = "✓" if tx.get("status") == 2 else "○"
+            row_format = _ROW_FMT.format
+            for i, record in enumerate(recent, 1):
+                add(row_format(
+                    i=i,
+                    status=_STATUS[record.status == 2],
+                    date=record.created_at if record.created_at is not None else "N/A",
+                    tx_type=record.tx_type,
+                    amount=record.amount,
+                    units=record.units
+                ))
 
-                print(f"{i:2}. [{status}] {date:<25} {tx_type:<15} {amount:>8.2f} RM  {units:>8.2f} units")
+            remaining = analysis["total_transactions"] - len(recent)
+            if remaining > 0:
+                add(f"\n... and {remaining} more transactions")
 
-            if len(sorted_txs) > 20:
-                print(f"\n... and {len(sorted_txs) - 20} more transactions")
+        add("\n" + "="*100 + "\n")
 
-        print("\n" + "="*100 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-    def display_date_range_options(self) -> Tuple[str, str]:
+    def display_date_range_options(self) -> Tuple[Optional[str], Optional[str]]:
         """
         Display date range options and let user choose.
 
         Returns:
-            Tuple of (date_from, date_to) in YYYY-MM-DD format
+            Tuple of (date_from, date_to) in YYYY-MM-DD format, or (None, None) if cancelled
         """
         print("\nSelect date range for transaction history:")
         print("1. Last 30 days")
@@ -209,55 +327,55 @@ class TransactionHistoryManager:
         print("7. Custom date range")
         print("8. Cancel")
 
+        # Preset ranges are fixed for this prompt, so format them once up front
+        today = datetime.now()
+        today_str = today.strftime("%Y-%m-%d")
+        presets = {
+            choice: ((today - timedelta(days=days)).strftime("%Y-%m-%d"), today_str)
+            for choice, days in _PRESET_DAYS.items()
+        }
+        # The remaining choices dispatch to a handler
+        handlers = {
+            "7": self._prompt_custom_date_range,
+            "8": lambda: (None, None),
+        }
+
         while True:
             choice = input("\nEnter your choice (1-8): ").strip()
 
-            today = datetime.now()
-
-            if choice == "1":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=30)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "2":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=60)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "3":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=90)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "4":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=180)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "5":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=365)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "6":
-                date_to = today.strftime("%Y-%m-%d")
-                date_from = (today - timedelta(days=365*5)).strftime("%Y-%m-%d")
-                return date_from, date_to
-            elif choice == "7":
-                while True:
-                    date_from_input = input("Enter start date (YYYY-MM-DD): ").strip()
-                    try:
-                        datetime.strptime(date_from_input, "%Y-%m-%d")
-                        break
-                    except ValueError:
-                        print("Invalid date format. Please use YYYY-MM-DD")
-
-                while True:
-                    date_to_input = input("Enter end date (YYYY-MM-DD): ").strip()
-                    try:
-                        datetime.strptime(date_to_input, "%Y-%m-%d")
-                        if date_to_input >= date_from_input:
-                            return date_from_input, date_to_input
-                        else:
-                            print("End date must be after start date")
-                    except ValueError:
-                        print("Invalid date format. Please use YYYY-MM-DD")
-            elif choice == "8":
-                return None, None
-            else:
-                print("Invalid choice. Please enter 1-8")
+            preset = presets.get(choice)
+            if preset is not None:
+                return preset
+
+            handler = handlers.get(choice)
+            if handler is not None:
+                return handler()
+
+            print("Invalid choice. Please enter 1-8")
+
+    def _prompt_custom_date_range(self) -> Tuple[str, str]:
+        """
+        Ask the user for a custom start and end date.
+
+        Returns:
+            Tuple of (date_from, date_to) in YYYY-MM-DD format
+        """
+        while True:
+            date_from_input = input("Enter start date (YYYY-MM-DD): ").strip()
+            try:
+                # Normalized, since newer Pythons also accept other ISO spellings
+                date_from_input = date.fromisoformat(date_from_input).isoformat()
+                break
+            except ValueError:
+                print("Invalid date format. Please use YYYY-MM-DD")
+
+        while True:
+            date_to_input = input("Enter end date (YYYY-MM-DD): ").strip()
+            try:
+                date_to_input = date.fromisoformat(date_to_input).isoformat()
+                if date_to_input >= date_from_input:
+                    return date_from_input, date_to_input
+                else:
+                    print("End date must be after start date")
+            except ValueError:
+                print("Invalid date format. Please use YYYY-MM-DD")